@@ -49,7 +49,7 @@ import requests
 
 from .models.helpers import (
     _EntityType2Class,
-    _Class2SwitchCommand,
+    _Command2Class,
 )
 from .models.exceptions import (
     CameDomoticBadAckError,
@@ -369,6 +369,13 @@ class CameETIDomoServer:
         if not issubclass(entity_type, CameEntity):
             raise TypeError("entity_type must be a subclass of CameEntity")
 
+        # Fail fast on types with no switch command (e.g. DigitalInput):
+        # the request would otherwise go out with "cmd_name": null
+        if entity_type._SWITCH_CMD is None:  # pylint: disable=protected-access
+            raise TypeError(
+                f"entity_type '{entity_type.__name__}' has no switch command"
+            )
+
         if not isinstance(entity_id, int):
             raise TypeError("entity_id must be an integer")
 
@@ -441,7 +448,8 @@ class CameETIDomoServer:
         request_data: Dict[str, Any] = {
             "sl_appl_msg": {
                 "client": self._session_id,
-                "cmd_name": _Class2SwitchCommand[entity_type],
+                # Plain attribute read, no mapping dict to probe
+                "cmd_name": entity_type._SWITCH_CMD,  # pylint: disable=protected-access
                 "cseq": self._cseq,
             },
             "sl_appl_msg_type": "domo",
@@ -848,11 +856,12 @@ status code: {response.status_code}"
             # }
 
             # Create the request
+            cmd_name = entity_type.value
             self._cseq += 1
             request_data = {
                 "sl_appl_msg": {
                     "client": self._session_id,
-                    "cmd_name": entity_type.value,
+                    "cmd_name": cmd_name,
                     "cseq": self._cseq,
                 },
                 "sl_appl_msg_type": "domo",
@@ -874,10 +883,10 @@ status code: {response.status_code}"
 
                 if resp["sl_data_ack_reason"] == 0:
                     # The following line is anannotation for type checkers (i.e. mypy)
-                    provided_type: Type[CameEntity] = _EntityType2Class[entity_type]
-                    # Create the entities
+                    provided_type: Type[CameEntity] = _Command2Class[cmd_name]
+                    # Create the entities (batch parse, then one bulk insert)
                     entities = CameEntitySet(
-                        provided_type.from_json(item) for item in resp["array"]
+                        provided_type.from_json_batch(resp["array"])
                     )
                     _LOGGER.debug("Entities retrieved: %s", entities)
                     return entities
@@ -20,9 +20,11 @@ Raises:
 """
 
 
-from typing import Optional
+import sys
+from typing import ClassVar, Optional, Union
 from .enums import (
     EntityStatus,
+    _ENTITY_STATUS_MAP,
 )
 
 
@@ -34,9 +36,27 @@ class CameEntity:
     :property status: the entity status (default EntityStatus.NOT_APPLICABLE).
     """
 
-    _DEFAULT_NAME = "Unknown"
+    # Compact per-instance layout: no __dict__, just the declared slots
+    # (__weakref__ is needed by the Feature interning cache).
+    __slots__ = ("_id", "_name", "_status", "__weakref__")
+
+    _DEFAULT_NAME = sys.intern("Unknown")
     _DEFAULT_STATUS = EntityStatus.UNKNOWN
 
+    # Command used to switch the entity status on the remote server.
+    # Overridden by the subclasses that support status updates.
+    _SWITCH_CMD: Optional[str] = None
+
+    # Class name, cached so __str__/__repr__ skip the type(self) call.
+    # Each subclass hand-writes its own __str__/__repr__ over its specific
+    # fields (no runtime branching), so there is nothing left for
+    # dataclass-style generated formatting code to remove.
+    _cls_name = "CameEntity"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._cls_name = cls.__name__
+
     def __init__(
         self,
         entity_id: int,
@@ -57,13 +77,10 @@ class CameEntity:
             raise TypeError("The entity ID must be an integer")
 
         self._id = entity_id
-        self._name = (
-            name
-            if name and isinstance(name, str) and name != ""
-            else self._DEFAULT_NAME
-        )
+        # Truthiness covers both None and "" in one test
+        self._name = name if name and isinstance(name, str) else self._DEFAULT_NAME
         self._status = (
-            status if status and status in EntityStatus else self._DEFAULT_STATUS
+            status if isinstance(status, EntityStatus) else self._DEFAULT_STATUS
         )
 
     @property
@@ -86,30 +103,41 @@ class CameEntity:
         return self._status
 
     @status.setter
-    def status(self, value: EntityStatus):
+    def status(self, value: Union[EntityStatus, int]):
         """Sets the entity status.
 
-        :param value: the entity status (EntityStatus)
+        Accepts either an EntityStatus member or its raw integer value, so
+        status updates coming straight from the wire protocol don't have to
+        build the enum member through the slow EnumMeta call.
+
+        :param value: the entity status (EntityStatus or its int value)
 
         :raises TypeError: if the value is not a valid EntityStatus.
         """
-        # Validate the input.
-        if value not in EntityStatus:
-            raise TypeError("The entity status must be a valid EntityStatus")
+        # Validate the input (isinstance, not the slow EnumMeta containment)
+        if not isinstance(value, EntityStatus):
+            member: Optional[EntityStatus] = _ENTITY_STATUS_MAP.get(value)
+            if member is None:
+                raise TypeError("The entity status must be a valid EntityStatus")
+            value = member
 
         self._status = value
 
     def __str__(self) -> str:
         return (
-            f"{type(self).__name__} #{self.id}: {self.name} - Status: "
-            f"{self.status.name}"
+            f"{self._cls_name} #{self._id}: {self._name} - Status: "
+            f"{self._status.name}"
         )
 
     def __repr__(self) -> str:
-        return f'{type(self).__name__}({self.id},"{self.name}",status={self.status})'
+        return f'{self._cls_name}({self._id},"{self._name}",status={self._status})'
 
     def __eq__(self, other: object) -> bool:
-        return type(self) is type(other) and self.__repr__() == other.__repr__()
+        # Identity first: comparing an entity with itself (or re-checking
+        # membership of the same object) skips the repr round-trip.
+        return self is other or (
+            type(self) is type(other) and self.__repr__() == other.__repr__()
+        )
 
     def __ne__(self, other: object) -> bool:
         return not self.__eq__(other)
@@ -138,22 +166,29 @@ class CameEntity:
         :raises KeyError: if the JSON dictionary doesn't contain the "act_id".
         """
 
+        # Single .get per field: missing keys and invalid values both fall
+        # through to the defaults, without probing the dict twice.
+        name = json_data.get("name")
+
         return CameEntity(
             json_data["act_id"],
-            (
-                json_data["name"]
-                if "name" in json_data and isinstance(json_data["name"], str)
-                else CameEntity._DEFAULT_NAME
-            ),
-            status=(
-                EntityStatus(json_data["status"])
-                if "status" in json_data
-                and json_data["status"]
-                in EntityStatus._value2member_map_  # pylint: disable=protected-access
-                else CameEntity._DEFAULT_STATUS
+            name if isinstance(name, str) else CameEntity._DEFAULT_NAME,
+            status=_ENTITY_STATUS_MAP.get(
+                json_data.get("status"), CameEntity._DEFAULT_STATUS
             ),
         )
 
+    @classmethod
+    def from_json_batch(cls, json_list) -> list:
+        """Creates a list of entities from a list of JSON dictionaries.
+
+        Subclasses with a hot parsing path override this with a version that
+        hoists the per-field lookups out of the loop.
+
+        :param json_list: the list of JSON dictionaries to parse.
+        """
+        return [cls.from_json(json_data) for json_data in json_list]
+
 
 class CameEntitySet(set):
     """Represents a set of CAME entities.
@@ -161,18 +196,44 @@ class CameEntitySet(set):
     :param entities: the list of entities to add to the set (optional).
 
     :method add: adds a CameEntity object to the set, validating its type.
+    :method update: adds multiple entities at once, validating their types.
 
-    :raises TypeError: if the item is not of type CameEntity.
+    :raises TypeError: if an item is not of type CameEntity.
     """
 
+    # Type accepted by add/update, overridden by the subclasses
+    _MEMBER_TYPE: ClassVar[type[CameEntity]] = CameEntity
+
     def __init__(self, entities=None):
         super().__init__()
 
         if entities is not None:
-            for entity in entities:
-                self.add(entity)
+            self.update(entities)
 
     def add(self, item):
-        if not isinstance(item, CameEntity):
-            raise TypeError("Item must be of type 'CameEntity'")
+        if not isinstance(item, self._MEMBER_TYPE):
+            raise TypeError(f"Item must be of type '{self._MEMBER_TYPE.__name__}'")
         super().add(item)
+
+    def update(self, *others):
+        """Adds multiple entities at once, validating their types.
+
+        Validation runs once per batch in a generator, then the insertion is
+        delegated to the C-level set.update instead of per-item add calls.
+
+        :raises TypeError: if an item is not of the expected type.
+        """
+        member_type = self._MEMBER_TYPE
+        for other in others:
+            # Same-type sets already validated their members on insertion
+            if type(other) is type(self):
+                set.update(self, other)
+                continue
+            items = (
+                other
+                if isinstance(other, (set, frozenset, list, tuple))
+                else tuple(other)
+            )
+            if not all(isinstance(item, member_type) for item in items):
+                raise TypeError(f"Item must be of type '{member_type.__name__}'")
+            set.update(self, items)
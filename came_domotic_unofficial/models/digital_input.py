@@ -20,7 +20,7 @@ This module contains the DigitalInput class, which represents a CAME digital inp
 from datetime import datetime, UTC
 from typing import Optional
 from .came_entity import CameEntity
-from .enums import DigitalInputType, EntityStatus
+from .enums import DigitalInputType, EntityStatus, _DIGITAL_INPUT_TYPE_MAP
 
 
 class DigitalInput(CameEntity):
@@ -39,6 +39,16 @@ class DigitalInput(CameEntity):
     :param utc_time: the digital input UTC time offset (default: 0).
     """
 
+    __slots__ = (
+        "_button_type",
+        "_address",
+        "_ack_code",
+        "_radio_node_id",
+        "_rf_radio_link_quality",
+        "_utc_time",
+        "_last_pressed",
+    )
+
     _DEFAULT_BUTTON_TYPE = DigitalInputType.BUTTON
     _DEFAULT_ADDRESS = 0
     _DEFAULT_ACK_CODE = 1
@@ -71,7 +81,7 @@ class DigitalInput(CameEntity):
             utc_time (int, optional): UNIX epoch of the last trigger of the device. Defaults to 0.
         """
         # Validate the input
-        if button_type not in DigitalInputType:
+        if not isinstance(button_type, DigitalInputType):
             raise TypeError("The digital input type must be a valid DigitalInType")
         if address is not None and not isinstance(address, int):
             raise TypeError("The digital input address must be an integer")
@@ -92,6 +102,7 @@ class DigitalInput(CameEntity):
         self._radio_node_id = radio_node_id
         self._rf_radio_link_quality = rf_radio_link_quality
         self._utc_time = utc_time
+        self._last_pressed: Optional[datetime] = None  # Computed lazily
 
         super().__init__(
             entity_id,
@@ -127,24 +138,30 @@ class DigitalInput(CameEntity):
 
     @property
     def last_pressed(self) -> datetime:
-        """Returns the digital input UTC time offset."""
-        return datetime.fromtimestamp(self._utc_time, UTC)
+        """Returns the digital input UTC time offset.
+
+        The conversion from Unix epoch is computed on first access and then
+        cached, since the underlying timestamp never changes.
+        """
+        if self._last_pressed is None:
+            self._last_pressed = datetime.fromtimestamp(self._utc_time, UTC)
+        return self._last_pressed
 
     def __str__(self) -> str:
         return (
-            f'{type(self).__name__} #{self.id}: "{self.name}" - '
-            f"Type: {self.button_type.name} - Address: {self.address} - "
-            f'Ack code: {self.ack_code} - Radio node ID: "{self.radio_node_id}" - '
-            f"RF radio link quality: {self.rf_radio_link_quality} - "
+            f'{self._cls_name} #{self._id}: "{self._name}" - '
+            f"Type: {self._button_type.name} - Address: {self._address} - "
+            f'Ack code: {self._ack_code} - Radio node ID: "{self._radio_node_id}" - '
+            f"RF radio link quality: {self._rf_radio_link_quality} - "
             f"Last pressed: {self.last_pressed}"
         )
 
     def __repr__(self) -> str:
         return (
-            f'{type(self).__name__}({self.id},"{self.name}",'
-            f"button_type={self.button_type},address={self.address},"
-            f'ack_code={self.ack_code},radio_node_id="{self.radio_node_id}",'
-            f"rf_radio_link_quality={self.rf_radio_link_quality},"
+            f'{self._cls_name}({self._id},"{self._name}",'
+            f"button_type={self._button_type},address={self._address},"
+            f'ack_code={self._ack_code},radio_node_id="{self._radio_node_id}",'
+            f"rf_radio_link_quality={self._rf_radio_link_quality},"
             f"utc_time={self._utc_time})"
         )
 
@@ -175,43 +192,42 @@ class DigitalInput(CameEntity):
         :raises KeyError: if the JSON dictionary doesn't contain the "act_id"
         """
 
+        # Single .get per field: missing keys and invalid values both fall
+        # through to the defaults, without probing the dict twice.
+        name = json_data.get("name")
+        address = json_data.get("addr")
+        ack_code = json_data.get("ack")
+        radio_node_id = json_data.get("radio_node_id")
+        rf_radio_link_quality = json_data.get("rf_radio_link_quality")
+        utc_time = json_data.get("utc_time")
+
         return DigitalInput(
             entity_id=json_data["act_id"],
-            name=(
-                json_data["name"]
-                if "name" in json_data and isinstance(json_data["name"], str)
-                else CameEntity._DEFAULT_NAME
-            ),
-            button_type=(
-                DigitalInputType(json_data["type"])
-                if "type" in json_data and json_data["type"] in DigitalInputType
-                else DigitalInput._DEFAULT_BUTTON_TYPE
+            name=name if isinstance(name, str) else CameEntity._DEFAULT_NAME,
+            button_type=_DIGITAL_INPUT_TYPE_MAP.get(
+                json_data.get("type"), DigitalInput._DEFAULT_BUTTON_TYPE
             ),
             address=(
-                json_data["addr"]
-                if "addr" in json_data and isinstance(json_data["addr"], int)
-                else DigitalInput._DEFAULT_ADDRESS
+                address if isinstance(address, int) else DigitalInput._DEFAULT_ADDRESS
             ),
             ack_code=(
-                json_data["ack"]
-                if "ack" in json_data and isinstance(json_data["ack"], int)
+                ack_code
+                if isinstance(ack_code, int)
                 else DigitalInput._DEFAULT_ACK_CODE
             ),
             radio_node_id=(
-                json_data["radio_node_id"]
-                if "radio_node_id" in json_data
-                and isinstance(json_data["radio_node_id"], str)
+                radio_node_id
+                if isinstance(radio_node_id, str)
                 else DigitalInput._DEFAULT_RADIO_NODE_ID
             ),
             rf_radio_link_quality=(
-                json_data["rf_radio_link_quality"]
-                if "rf_radio_link_quality" in json_data
-                and isinstance(json_data["rf_radio_link_quality"], int)
+                rf_radio_link_quality
+                if isinstance(rf_radio_link_quality, int)
                 else DigitalInput._DEFAULT_RF_RADIO_LINK_QUALITY
             ),
             utc_time=(
-                json_data["utc_time"]
-                if "utc_time" in json_data and isinstance(json_data["utc_time"], int)
+                utc_time
+                if isinstance(utc_time, int)
                 else DigitalInput._DEFAULT_UTC_TIME
             ),
         )
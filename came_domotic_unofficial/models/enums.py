@@ -109,3 +109,16 @@ class ThermoZoneStatus(Enum):
     MANUAL = 1
     AUTO = 2
     JOLLY = 3
+
+
+# Plain-dict views of the enum value maps (the dicts backing Enum.__call__),
+# bound once at import time so the parsing hot paths resolve raw JSON values
+# with a single C-level dict lookup instead of the EnumMeta machinery.
+# pylint: disable=protected-access
+_ENTITY_STATUS_MAP: dict = EntityStatus._value2member_map_
+_LIGHT_TYPE_MAP: dict = LightType._value2member_map_
+_OPENING_TYPE_MAP: dict = OpeningType._value2member_map_
+_DIGITAL_INPUT_TYPE_MAP: dict = DigitalInputType._value2member_map_
+_SCENARIO_STATUS_MAP: dict = ScenarioStatus._value2member_map_
+_SCENARIO_ICON_MAP: dict = ScenarioIcon._value2member_map_
+# pylint: enable=protected-access
@@ -14,6 +14,8 @@
 
 """This module contains the class representing a CAME feature."""
 
+from weakref import WeakValueDictionary
+
 from .came_entity import CameEntity, CameEntitySet
 from .enums import EntityStatus
 
@@ -25,9 +27,36 @@ class Feature(CameEntity):
     represent a CAME server feature. The feature name is used as the unique
     identifier for the feature, and it's used to generate the entity ID.
 
+    Instances are interned: creating two features with the same name returns
+    the same object, so equality and set membership reduce to an identity
+    check in the common case.
+
     :property name: the feature name.
     """
 
+    __slots__ = ("_hash",)
+
+    # Cache of live instances, keyed by name. Weak references, so interning
+    # doesn't keep otherwise unused features alive.
+    _interned: "WeakValueDictionary[str, Feature]" = WeakValueDictionary()
+
+    def __new__(cls, name: str):
+        # Reuse the existing instance, if any (invalid names are dealt
+        # with by __init__, which raises a TypeError)
+        if isinstance(name, str):
+            existing = cls._interned.get(name)
+            # Exact-type check: a subclass must not reuse a Feature instance
+            if (
+                existing is not None
+                and type(existing) is cls  # pylint: disable=unidiomatic-typecheck
+            ):
+                return existing
+
+        instance = super().__new__(cls)
+        if isinstance(name, str) and name != "":
+            cls._interned[name] = instance
+        return instance
+
     def __init__(self, name: str):
         """Constructor for the Feature class.
 
@@ -38,48 +67,48 @@ class Feature(CameEntity):
         if name is None or not isinstance(name, str) or name == "":
             raise TypeError("The feature name must be a non-empty string")
 
+        # Skip re-initialization of interned (already initialized) instances
+        if getattr(self, "_name", None) == name:
+            return
+
         super().__init__(
             entity_id=hash(name),  # Use an arbitrary ID, based on the name
             name=name,
             status=EntityStatus.NOT_APPLICABLE,
         )
-
-    @property
-    def name(self) -> str:
-        """Returns the feature name."""
-        return self._name
+        self._hash = hash((type(self), name))  # Cached for set lookups
 
     def __str__(self) -> str:
-        return f"{type(self).__name__}: {self.name}"
+        return f"{self._cls_name}: {self._name}"
 
     def __repr__(self) -> str:
-        return f'{type(self).__name__}("{self.name}")'
-
-    # #Override the equality operator: features with the same name are the same
-    # def __eq__(self, other):
-    #     return type(self) is type(other) and self.name == other.name
+        return f'{self._cls_name}("{self._name}")'
+
+    def __eq__(self, other: object) -> bool:
+        # Thanks to interning, same-name features are the same object, so
+        # equality is a pointer compare in the common case.
+        return self is other or (
+            self.__class__ is other.__class__
+            and self._name == other._name  # type: ignore[attr-defined]
+        )
 
-    # # Override the inequality operator
-    # def __ne__(self, other):
-    #     return not self.__eq__(other)
+    def __ne__(self, other: object) -> bool:
+        return not self.__eq__(other)
 
-    # # Override the hash function
-    # def __hash__(self):
-    #     return hash((type(self), self.name))
+    def __hash__(self) -> int:
+        return self._hash
 
 
 class FeatureSet(CameEntitySet):
     """Represents a set of features managed by a CAME ETI/Domo server.
 
     :method add: adds a Feature object to the set, validating its type.
+    :method update: adds multiple features at once, validating their types.
 
-    :raises TypeError: if the item is not of type Feature.
+    :raises TypeError: if an item is not of type Feature.
     """
 
-    def add(self, item):
-        if not isinstance(item, Feature):
-            raise TypeError("Item must be of type 'Feature'")
-        super().add(item)
+    _MEMBER_TYPE = Feature
 
     @staticmethod
     def from_json(features_list: dict):
@@ -45,10 +45,12 @@ _EntityType2Class: dict[EntityType, Type[CameEntity]] = {
     # EntityType.MAPS:
 }
 
-_Class2SwitchCommand = {
-    Light: "light_switch_req",
-    Opening: "opening_move_req",
-    Scenario: "scenario_activation_req",
+# Same mapping keyed by the raw list-request command string (the enum
+# member's value), precomputed so dispatch from a command needs a single
+# dict probe instead of an EntityType construction plus a lookup.
+_Command2Class: dict[str, Type[CameEntity]] = {
+    entity_type.value: entity_class
+    for entity_type, entity_class in _EntityType2Class.items()
 }
 
 # endregion
@@ -14,9 +14,15 @@
 
 """This module contains the class representing a CAME opening."""
 
+from array import array
 from typing import Optional
 from .came_entity import CameEntity
-from .enums import EntityStatus, OpeningType
+from .enums import EntityStatus, OpeningType, _ENTITY_STATUS_MAP, _OPENING_TYPE_MAP
+
+# Module-level bindings of the defaults used on the parsing hot path:
+# a single global load instead of a class-attribute chain per field.
+_DEFAULT_STATUS = EntityStatus.UNKNOWN
+_DEFAULT_OPENING_TYPE = OpeningType.OPEN_CLOSE
 
 
 class Opening(CameEntity):
@@ -35,8 +41,12 @@ class Opening(CameEntity):
     :method from_json: create an Opening object from a JSON dictionary.
     """
 
-    _DEFAULT_STATUS = EntityStatus.UNKNOWN
-    _DEFAULT_OPENING_TYPE = OpeningType.OPEN_CLOSE
+    __slots__ = ("_close_entity_id", "_opening_type", "_partial_openings")
+
+    _DEFAULT_STATUS = _DEFAULT_STATUS
+    _DEFAULT_OPENING_TYPE = _DEFAULT_OPENING_TYPE
+
+    _SWITCH_CMD = "opening_move_req"
 
     def __init__(
         self,
@@ -62,16 +72,34 @@ class Opening(CameEntity):
         # Input validation
         if close_entity_id is not None and not isinstance(close_entity_id, int):
             raise TypeError("The closing entity ID must be an integer")
-        if opening_type not in OpeningType:
+        if not isinstance(opening_type, OpeningType):
             raise TypeError("The opening type must be a valid OpeningType")
         if partial_openings is not None and not isinstance(partial_openings, list):
             raise TypeError("The partial openings must be a list")
 
-        self._close_entity_id = close_entity_id if close_entity_id else entity_id
-        self._opening_type = (
-            opening_type if opening_type else self._DEFAULT_OPENING_TYPE
+        # 'is None' rather than truthiness: 0 is a legitimate entity ID
+        self._close_entity_id = (
+            entity_id if close_entity_id is None else close_entity_id
         )
-        self._partial_openings = partial_openings if partial_openings else []
+        # Already validated above, no need for a second truthiness probe
+        # (OPEN_CLOSE has value 0 and is falsy, so the old idiom was wrong)
+        self._opening_type = opening_type
+        # One byte per partial-opening percentage, instead of a list of
+        # full Python int objects. The common (valid) case builds straight
+        # from the list; a list with out-of-range or non-int entries falls
+        # back to a sanitizing pass (clamp to 0-255, drop non-ints) rather
+        # than raising mid-parse for one odd device.
+        try:
+            self._partial_openings = array("B", partial_openings or ())
+        except (TypeError, ValueError, OverflowError):
+            self._partial_openings = array(
+                "B",
+                (
+                    max(0, min(255, entry))
+                    for entry in (partial_openings or ())
+                    if isinstance(entry, int)
+                ),
+            )
 
         super().__init__(
             entity_id,
@@ -91,8 +119,12 @@ class Opening(CameEntity):
         return self._close_entity_id
 
     @property
-    def partial_openings(self) -> list:
-        """Returns the list of partial openings."""
+    def partial_openings(self) -> array:
+        """Returns the partial openings (byte array, list-like).
+
+        Note that an array compares unequal to a plain list with the same
+        entries: wrap it in list() when comparing against one.
+        """
         return self._partial_openings
 
     # TODO Implement partial_openings management (once examples are available)
@@ -103,17 +135,17 @@ class Opening(CameEntity):
 
     def __str__(self) -> str:
         return (
-            f"{type(self).__name__} #{self.id}/{self.close_entity_id}: "
-            f'"{self.name}" - Type: {self.opening_type.name} - '
-            f"Status: {self.status.name} - Partials: {self.partial_openings}"
+            f"{self._cls_name} #{self._id}/{self._close_entity_id}: "
+            f'"{self._name}" - Type: {self._opening_type.name} - '
+            f"Status: {self._status.name} - Partials: {list(self._partial_openings)}"
         )
 
     def __repr__(self) -> str:
         return (
-            f'{type(self).__name__}({self.id},"{self.name}",'
-            f"close_entity_id={self.close_entity_id},status={self.status},"
-            f"opening_type={self.opening_type},"
-            f"partial_openings={self.partial_openings})"
+            f'{self._cls_name}({self._id},"{self._name}",'
+            f"close_entity_id={self._close_entity_id},status={self._status},"
+            f"opening_type={self._opening_type},"
+            f"partial_openings={list(self._partial_openings)})"
         )
 
     @staticmethod
@@ -141,36 +173,64 @@ class Opening(CameEntity):
         :raises KeyError: if the JSON dictionary doesn't contain the "open_act_id".
         """
 
+        # Single .get per field: missing keys and invalid values both fall
+        # through to the defaults, without probing the dict twice.
+        open_act_id = json_data["open_act_id"]
+        close_entity_id = json_data.get("close_act_id")
+        name = json_data.get("name")
+        partial_openings = json_data.get("partial")
+
         return Opening(
-            entity_id=json_data["open_act_id"],
+            entity_id=open_act_id,
             close_entity_id=(
-                json_data["close_act_id"]
-                if "close_act_id" in json_data
-                and isinstance(json_data["close_act_id"], int)
-                else json_data["open_act_id"]
+                close_entity_id if isinstance(close_entity_id, int) else open_act_id
             ),
-            name=(
-                json_data["name"]
-                if "name" in json_data and isinstance(json_data["name"], str)
-                else CameEntity._DEFAULT_NAME
-            ),
-            status=(
-                EntityStatus(json_data["status"])
-                if "status" in json_data
-                and json_data["status"]
-                in EntityStatus._value2member_map_  # pylint: disable=protected-access
-                else Opening._DEFAULT_STATUS
-            ),
-            opening_type=(
-                OpeningType(json_data["type"])
-                if "type" in json_data
-                and json_data["type"]
-                in OpeningType._value2member_map_  # pylint: disable=protected-access
-                else Opening._DEFAULT_OPENING_TYPE
+            name=name if isinstance(name, str) else CameEntity._DEFAULT_NAME,
+            status=_ENTITY_STATUS_MAP.get(json_data.get("status"), _DEFAULT_STATUS),
+            opening_type=_OPENING_TYPE_MAP.get(
+                json_data.get("type"), _DEFAULT_OPENING_TYPE
             ),
             partial_openings=(
-                json_data["partial"]
-                if "partial" in json_data and isinstance(json_data["partial"], list)
-                else None
+                partial_openings if isinstance(partial_openings, list) else None
             ),
         )
+
+    @classmethod
+    def from_json_batch(cls, json_list) -> list:
+        """Creates a list of Opening objects from a list of JSON dictionaries.
+
+        Same semantics as from_json, with the enum value maps and defaults
+        hoisted out of the loop for the hundreds-of-devices case.
+
+        :param json_list: the list of JSON dictionaries to parse.
+        """
+        # Everything the loop touches is pre-bound to a local: LOAD_FAST
+        # instead of a global (or attribute) load on every entity.
+        get_status = _ENTITY_STATUS_MAP.get
+        get_type = _OPENING_TYPE_MAP.get
+        default_name = CameEntity._DEFAULT_NAME
+        default_status = _DEFAULT_STATUS
+        default_type = _DEFAULT_OPENING_TYPE
+        openings = []
+        for json_data in json_list:
+            open_act_id = json_data["open_act_id"]
+            close_entity_id = json_data.get("close_act_id")
+            name = json_data.get("name")
+            partial_openings = json_data.get("partial")
+            openings.append(
+                cls(
+                    entity_id=open_act_id,
+                    close_entity_id=(
+                        close_entity_id
+                        if isinstance(close_entity_id, int)
+                        else open_act_id
+                    ),
+                    name=name if isinstance(name, str) else default_name,
+                    status=get_status(json_data.get("status"), default_status),
+                    opening_type=get_type(json_data.get("type"), default_type),
+                    partial_openings=(
+                        partial_openings if isinstance(partial_openings, list) else None
+                    ),
+                )
+            )
+        return openings
@@ -21,7 +21,14 @@ Raises:
 
 from typing import Optional
 from .came_entity import CameEntity
-from .enums import EntityStatus, ScenarioStatus, ScenarioIcon
+from .enums import (
+    EntityStatus,
+    ScenarioStatus,
+    ScenarioIcon,
+    _ENTITY_STATUS_MAP,
+    _SCENARIO_STATUS_MAP,
+    _SCENARIO_ICON_MAP,
+)
 
 
 class Scenario(CameEntity):
@@ -40,10 +47,14 @@ class Scenario(CameEntity):
     :method from_json: create a Scenario object from a JSON dictionary.
     """
 
+    __slots__ = ("_scenario_status", "_icon", "_is_user_defined")
+
     _DEFAULT_STATUS = EntityStatus.UNKNOWN
     _DEFAULT_SCENARIO_STATUS = ScenarioStatus.NOT_APPLIED
     _DEFAULT_ICON_ID = ScenarioIcon.UNKNOWN
 
+    _SWITCH_CMD = "scenario_activation_req"
+
     def __init__(
         self,
         entity_id: int,
@@ -66,13 +77,16 @@ class Scenario(CameEntity):
             is_user_defined (bool, optional): whether the scenario is user defined. Defaults to False.
         """
 
-        # Validate the input
-        if scenario_status not in ScenarioStatus:
-            raise TypeError("The scenario status must be a valid ScenarioStatus")
-        if icon not in ScenarioIcon:
-            raise TypeError("The scenario icon must be a valid ScenarioIcon")
-        if is_user_defined is not None and not isinstance(is_user_defined, bool):
-            raise TypeError("The is_user_defined value must be a boolean")
+        # Validate the input. from_json already normalizes its values, so the
+        # checks are debug-only: running with `python -O` strips them from the
+        # per-construction cost.
+        if __debug__:
+            if not isinstance(scenario_status, ScenarioStatus):
+                raise TypeError("The scenario status must be a valid ScenarioStatus")
+            if not isinstance(icon, ScenarioIcon):
+                raise TypeError("The scenario icon must be a valid ScenarioIcon")
+            if is_user_defined is not None and not isinstance(is_user_defined, bool):
+                raise TypeError("The is_user_defined value must be a boolean")
 
         self._scenario_status = scenario_status
         self._icon = icon
@@ -100,7 +114,7 @@ class Scenario(CameEntity):
         Raises:
             TypeError: if the value is not a valid ScenarioStatus.
         """
-        if value not in ScenarioStatus:
+        if __debug__ and not isinstance(value, ScenarioStatus):
             raise TypeError("The scenario status must be a valid ScenarioStatus")
 
         self._scenario_status = value
@@ -117,17 +131,17 @@ class Scenario(CameEntity):
 
     def __str__(self) -> str:
         return (
-            f'{type(self).__name__} #{self.id}: "{self.name}" - '
-            f"Status: {self.status.name} - "
-            f"Scenario status: {self.scenario_status.name} - "
-            f"Icon: {self.icon.name} - User defined: {self.is_user_defined}"
+            f'{self._cls_name} #{self._id}: "{self._name}" - '
+            f"Status: {self._status.name} - "
+            f"Scenario status: {self._scenario_status.name} - "
+            f"Icon: {self._icon.name} - User defined: {self._is_user_defined}"
         )
 
     def __repr__(self) -> str:
         return (
-            f'{type(self).__name__}({self.id},"{self.name}",'
-            f"status={self.status},scenario_status={self.scenario_status},"
-            f"icon={self.icon},is_user_defined={self.is_user_defined})"
+            f'{self._cls_name}({self._id},"{self._name}",'
+            f"status={self._status},scenario_status={self._scenario_status},"
+            f"icon={self._icon},is_user_defined={self._is_user_defined})"
         )
 
     @staticmethod
@@ -155,31 +169,25 @@ class Scenario(CameEntity):
         :raises KeyError: if the JSON dictionary doesn't contain the "id".
         """
 
+        # Single .get per field: missing keys and invalid values both fall
+        # through to the defaults. The enum fields go straight through
+        # _value2member_map_ (the dict backing Enum.__call__), skipping the
+        # much slower EnumMeta.__call__ path.
+        is_user_defined = json_data.get("user-defined")
+
         return Scenario(
             entity_id=json_data["id"],
-            name=(
-                json_data["name"] if "name" in json_data else CameEntity._DEFAULT_NAME
-            ),
-            status=(
-                EntityStatus(json_data["status"])
-                if "status" in json_data and json_data["status"] in EntityStatus
-                else Scenario._DEFAULT_STATUS
+            name=json_data.get("name", CameEntity._DEFAULT_NAME),
+            status=_ENTITY_STATUS_MAP.get(
+                json_data.get("status"), Scenario._DEFAULT_STATUS
             ),
-            scenario_status=(
-                ScenarioStatus(json_data["scenario_status"])
-                if "scenario_status" in json_data
-                and json_data["scenario_status"] in ScenarioStatus
-                else Scenario._DEFAULT_SCENARIO_STATUS
+            scenario_status=_SCENARIO_STATUS_MAP.get(
+                json_data.get("scenario_status"), Scenario._DEFAULT_SCENARIO_STATUS
             ),
-            icon=(
-                ScenarioIcon(json_data["icon_id"])
-                if "icon_id" in json_data and json_data["icon_id"] in ScenarioIcon
-                else Scenario._DEFAULT_ICON_ID
+            icon=_SCENARIO_ICON_MAP.get(
+                json_data.get("icon_id"), Scenario._DEFAULT_ICON_ID
             ),
             is_user_defined=(
-                bool(json_data["user-defined"])
-                if "user-defined" in json_data
-                and isinstance(json_data["user-defined"], int)
-                else False
+                bool(is_user_defined) if isinstance(is_user_defined, int) else False
             ),
         )
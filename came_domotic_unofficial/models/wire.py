@@ -0,0 +1,198 @@
+# Copyright 2024 - GitHub user: fredericks1982
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fast decoders from raw server JSON to lists of CAME entities.
+
+When the optional msgspec dependency is installed (``pip install
+came_domotic_unofficial[speed]``) the raw payload is decoded straight into
+typed, slotted structs by msgspec's C decoder, then adapted to the public
+entity classes. Without msgspec the decoders fall back to ``json.loads``
+plus the entities' own ``from_json`` parsers, so behavior is identical
+either way.
+"""
+
+import json
+from typing import List, Optional, Union
+
+from .came_entity import CameEntity
+from .digital_input import DigitalInput
+from .enums import (
+    _DIGITAL_INPUT_TYPE_MAP,
+    _ENTITY_STATUS_MAP,
+    _LIGHT_TYPE_MAP,
+    _OPENING_TYPE_MAP,
+    _SCENARIO_ICON_MAP,
+    _SCENARIO_STATUS_MAP,
+)
+from .light import Light
+from .opening import Opening
+from .scenario import Scenario
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the installed extras
+    msgspec = None  # type: ignore[assignment]  # pylint: disable=invalid-name
+
+# Module-level bindings of the entity class defaults used by the decoders,
+# mirroring the hoisting done by the entities' own batch parsers.
+# pylint: disable=protected-access
+_LIGHT_DEFAULT_STATUS = Light._DEFAULT_STATUS
+_LIGHT_DEFAULT_TYPE = Light._DEFAULT_LIGHT_TYPE
+_LIGHT_DEFAULT_BRIGHTNESS = Light._DEFAULT_BRIGHTNESS
+_OPENING_DEFAULT_STATUS = Opening._DEFAULT_STATUS
+_OPENING_DEFAULT_TYPE = Opening._DEFAULT_OPENING_TYPE
+_DIGITAL_INPUT_DEFAULT_TYPE = DigitalInput._DEFAULT_BUTTON_TYPE
+_SCENARIO_DEFAULT_STATUS = Scenario._DEFAULT_STATUS
+_SCENARIO_DEFAULT_SCENARIO_STATUS = Scenario._DEFAULT_SCENARIO_STATUS
+_SCENARIO_DEFAULT_ICON = Scenario._DEFAULT_ICON_ID
+# pylint: enable=protected-access
+
+
+def _fallback_decode(raw: Union[bytes, str], entity_class) -> List[CameEntity]:
+    """Decodes a JSON array with json.loads and the entity's from_json."""
+    return [entity_class.from_json(item) for item in json.loads(raw)]
+
+
+if msgspec is not None:
+
+    class _LightWire(msgspec.Struct):
+        """Wire mirror of the light JSON payload."""
+
+        act_id: int
+        name: Optional[str] = None
+        status: int = -1
+        type: str = ""
+        perc: int = _LIGHT_DEFAULT_BRIGHTNESS
+
+    class _OpeningWire(msgspec.Struct):
+        """Wire mirror of the opening JSON payload."""
+
+        open_act_id: int
+        close_act_id: Optional[int] = None
+        name: Optional[str] = None
+        status: int = -1
+        type: int = 0
+        partial: Optional[list] = None
+
+    class _DigitalInputWire(msgspec.Struct):
+        """Wire mirror of the digital input JSON payload."""
+
+        act_id: int
+        name: Optional[str] = None
+        type: int = 1
+        addr: int = 0
+        ack: int = 1
+        radio_node_id: str = "00000000"
+        rf_radio_link_quality: int = 0
+        utc_time: int = 0
+
+    class _ScenarioWire(msgspec.Struct, rename={"user_defined": "user-defined"}):
+        """Wire mirror of the scenario JSON payload."""
+
+        id: int
+        name: Optional[str] = None
+        status: int = -1
+        scenario_status: int = 0
+        icon_id: int = -1
+        user_defined: int = 0
+
+    def decode_lights(raw: Union[bytes, str]) -> List[Light]:
+        """Decodes a JSON array of lights into Light objects."""
+        wires = msgspec.json.decode(raw, type=List[_LightWire])
+        vmap_status = _ENTITY_STATUS_MAP
+        vmap_type = _LIGHT_TYPE_MAP
+        return [
+            Light(
+                wire.act_id,
+                wire.name,
+                status=vmap_status.get(wire.status, _LIGHT_DEFAULT_STATUS),
+                light_type=vmap_type.get(wire.type, _LIGHT_DEFAULT_TYPE),
+                brightness=wire.perc,
+            )
+            for wire in wires
+        ]
+
+    def decode_openings(raw: Union[bytes, str]) -> List[Opening]:
+        """Decodes a JSON array of openings into Opening objects."""
+        wires = msgspec.json.decode(raw, type=List[_OpeningWire])
+        vmap_status = _ENTITY_STATUS_MAP
+        vmap_type = _OPENING_TYPE_MAP
+        return [
+            Opening(
+                entity_id=wire.open_act_id,
+                close_entity_id=wire.close_act_id,
+                name=wire.name,
+                status=vmap_status.get(wire.status, _OPENING_DEFAULT_STATUS),
+                opening_type=vmap_type.get(wire.type, _OPENING_DEFAULT_TYPE),
+                partial_openings=wire.partial,
+            )
+            for wire in wires
+        ]
+
+    def decode_digital_inputs(raw: Union[bytes, str]) -> List[DigitalInput]:
+        """Decodes a JSON array of digital inputs into DigitalInput objects."""
+        wires = msgspec.json.decode(raw, type=List[_DigitalInputWire])
+        vmap_type = _DIGITAL_INPUT_TYPE_MAP
+        return [
+            DigitalInput(
+                entity_id=wire.act_id,
+                name=wire.name,
+                button_type=vmap_type.get(wire.type, _DIGITAL_INPUT_DEFAULT_TYPE),
+                address=wire.addr,
+                ack_code=wire.ack,
+                radio_node_id=wire.radio_node_id,
+                rf_radio_link_quality=wire.rf_radio_link_quality,
+                utc_time=wire.utc_time,
+            )
+            for wire in wires
+        ]
+
+    def decode_scenarios(raw: Union[bytes, str]) -> List[Scenario]:
+        """Decodes a JSON array of scenarios into Scenario objects."""
+        wires = msgspec.json.decode(raw, type=List[_ScenarioWire])
+        vmap_status = _ENTITY_STATUS_MAP
+        vmap_scenario = _SCENARIO_STATUS_MAP
+        vmap_icon = _SCENARIO_ICON_MAP
+        return [
+            Scenario(
+                entity_id=wire.id,
+                name=wire.name,
+                status=vmap_status.get(wire.status, _SCENARIO_DEFAULT_STATUS),
+                scenario_status=vmap_scenario.get(
+                    wire.scenario_status, _SCENARIO_DEFAULT_SCENARIO_STATUS
+                ),
+                icon=vmap_icon.get(wire.icon_id, _SCENARIO_DEFAULT_ICON),
+                is_user_defined=bool(wire.user_defined),
+            )
+            for wire in wires
+        ]
+
+else:
+
+    def decode_lights(raw: Union[bytes, str]) -> List[Light]:
+        """Decodes a JSON array of lights into Light objects."""
+        return _fallback_decode(raw, Light)
+
+    def decode_openings(raw: Union[bytes, str]) -> List[Opening]:
+        """Decodes a JSON array of openings into Opening objects."""
+        return _fallback_decode(raw, Opening)
+
+    def decode_digital_inputs(raw: Union[bytes, str]) -> List[DigitalInput]:
+        """Decodes a JSON array of digital inputs into DigitalInput objects."""
+        return _fallback_decode(raw, DigitalInput)
+
+    def decode_scenarios(raw: Union[bytes, str]) -> List[Scenario]:
+        """Decodes a JSON array of scenarios into Scenario objects."""
+        return _fallback_decode(raw, Scenario)
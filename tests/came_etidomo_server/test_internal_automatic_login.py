@@ -35,10 +35,15 @@ from came_domotic_unofficial.came_etidomo_server import CameETIDomoServer
 from came_domotic_unofficial.models import (
     CameDomoticAuthError,
     CameDomoticRequestError,
+    CameEntitySet,
+    FeatureSet,
     Light,
     EntityStatus,
 )
 
+# Session already expired on 2000-01-01: built once, reused by every test
+EXPIRED_TS = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
 public_properties = [
     "keycode",
     "software_version",
@@ -48,15 +53,49 @@ public_properties = [
 ]
 
 
-@pytest.fixture
-@patch("requests.Session.get", side_effect=mock_get_init)
-def mocked_server(mock_get) -> CameETIDomoServer:
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+@pytest.fixture(scope="module")
+def _server_instance() -> CameETIDomoServer:
+    # Build the server (and its requests.Session) once per module: every
+    # test gets the same instance, reset by the mocked_server fixture below.
+    with patch("requests.Session.get", side_effect=mock_get_init):
+        server = CameETIDomoServer("192.168.x.x", "user", "password")
     server.dispose = lambda: None  # type: ignore
     return server
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
+@pytest.fixture
+def mocked_server(_server_instance) -> CameETIDomoServer:
+    # Reset the mutable state touched by the tests, so each one still
+    # starts from the same "freshly constructed, not authenticated" server.
+    server = _server_instance
+    server._session_id = ""
+    server._session_keep_alive_timeout_sec = 0
+    server._session_expiration_timestamp = EXPIRED_TS
+    server._cseq = 0
+    server._keycode = ""
+    server._software_version = ""
+    server._type = ""
+    server._board = ""
+    server._serial_number = ""
+    server._features = FeatureSet()
+    server._entities = CameEntitySet()
+    return server
+
+
+@pytest.fixture(scope="module")
+def _post_patcher():
+    # One patcher entered/exited per module, instead of one per test
+    with patch("requests.Session.post", side_effect=mock_post_method) as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_post(_post_patcher):
+    # Restore the default dispatcher; error-path tests override side_effect
+    _post_patcher.side_effect = mock_post_method
+    return _post_patcher
+
+
 @pytest.mark.parametrize("property_name", public_properties)
 def test_get_property(mock_post, property_name, mocked_server):
     # Ensure that it is a "clean" situation
@@ -68,9 +107,9 @@ def test_get_property(mock_post, property_name, mocked_server):
     assert property_value and len(property_value) > 0
 
 
-@patch("requests.Session.post", side_effect=mock_post_method_error_auth)
 @pytest.mark.parametrize("property_name", public_properties)
 def test_get_property_auth_error(mock_post, property_name, mocked_server):
+    mock_post.side_effect = mock_post_method_error_auth
     # Ensure that it is a "clean" situation
     assert not mocked_server.is_authenticated
 
@@ -80,9 +119,9 @@ def test_get_property_auth_error(mock_post, property_name, mocked_server):
     assert not mocked_server.is_authenticated
 
 
-@patch("requests.Session.post", side_effect=mock_post_method_error_non_auth)
 @pytest.mark.parametrize("property_name", public_properties)
 def test_get_property_request_error(mock_post, property_name, mocked_server):
+    mock_post.side_effect = mock_post_method_error_non_auth
     # Ensure that it is a "clean" situation
     assert not mocked_server.is_authenticated
 
@@ -94,47 +133,36 @@ def test_get_property_request_error(mock_post, property_name, mocked_server):
 
 # TODO Check that when the get_features method of a CameETIDomoServer instance
 # is accessed the user is automatically authenticated before to proceed
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_get_features(mock_post, mocked_server):
-    # Ensure that it is a "clean" situation
-    assert not mocked_server.is_authenticated
-
-    # Call the function that uses requests.Session.post
-    result = mocked_server.get_features()
-    assert mocked_server.is_authenticated
-    assert result and len(result) > 0
-
-
-@patch("requests.Session.post", side_effect=mock_post_method_error_auth)
-def test_get_features_auth_error(mock_post, mocked_server):
-    # Ensure that it is a "clean" situation
-    assert not mocked_server.is_authenticated
-
-    # Call the function that uses requests.Session.post
-    with pytest.raises(CameDomoticAuthError):
-        mocked_server.get_features()
-    assert not mocked_server.is_authenticated
-
-
-@patch("requests.Session.post", side_effect=mock_post_method_error_non_auth)
-def test_get_features_request_error(mock_post, mocked_server):
+@pytest.mark.parametrize(
+    "side_effect, raises, authenticated_after",
+    [
+        (mock_post_method, None, True),
+        (mock_post_method_error_auth, CameDomoticAuthError, False),
+        (mock_post_method_error_non_auth, CameDomoticRequestError, True),
+    ],
+)
+def test_get_features(
+    mock_post, mocked_server, side_effect, raises, authenticated_after
+):
+    mock_post.side_effect = side_effect
     # Ensure that it is a "clean" situation
     assert not mocked_server.is_authenticated
 
     # Call the function that uses requests.Session.post
-    with pytest.raises(CameDomoticRequestError):
-        mocked_server.get_features()
-    assert mocked_server.is_authenticated
+    if raises:
+        with pytest.raises(raises):
+            mocked_server.get_features()
+    else:
+        result = mocked_server.get_features()
+        assert result and len(result) > 0
+    assert mocked_server.is_authenticated == authenticated_after
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
 def test_get_entities(mock_post, mocked_server):
     # Prepare the server: features already retrieved but session expired
     features = mocked_server.get_features()
     mocked_server._features = features
-    mocked_server._session_expiration_timestamp = datetime.datetime(
-        2000, 1, 1, tzinfo=datetime.timezone.utc
-    )
+    mocked_server._session_expiration_timestamp = EXPIRED_TS
     assert not mocked_server.is_authenticated
 
     # Test
@@ -143,99 +171,79 @@ def test_get_entities(mock_post, mocked_server):
     assert result and len(result) > 0
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
 def test_get_entities_auth_error(mock_post, mocked_server):
     # Prepare the server: features already retrieved but session expired
     features = mocked_server.get_features()
     mocked_server._features = features
-    mocked_server._session_expiration_timestamp = datetime.datetime(
-        2000, 1, 1, tzinfo=datetime.timezone.utc
-    )
+    mocked_server._session_expiration_timestamp = EXPIRED_TS
     assert not mocked_server.is_authenticated
 
     # Test
-    with patch("requests.Session.post", side_effect=mock_post_method_error_auth):
-        with pytest.raises(CameDomoticAuthError):
-            mocked_server.get_entities()
+    mock_post.side_effect = mock_post_method_error_auth
+    with pytest.raises(CameDomoticAuthError):
+        mocked_server.get_entities()
     assert not mocked_server.is_authenticated
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
 def test_get_entities_request_error(mock_post, mocked_server):
     # Prepare the server: features already retrieved but session expired
     features = mocked_server.get_features()
     mocked_server._features = features
-    mocked_server._session_expiration_timestamp = datetime.datetime(
-        2000, 1, 1, tzinfo=datetime.timezone.utc
-    )
+    mocked_server._session_expiration_timestamp = EXPIRED_TS
     assert not mocked_server.is_authenticated
 
     # Test
-    with patch("requests.Session.post", side_effect=mock_post_method_error_non_auth):
-        result = mocked_server.get_entities()
+    mock_post.side_effect = mock_post_method_error_non_auth
+    result = mocked_server.get_entities()
     assert mocked_server.is_authenticated
     assert not result  # Empty set of entities
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_set_status(mock_post, mocked_server):
-    # Prepare the server: features already retrieved but session expired
-    assert not mocked_server.is_authenticated
-
-    # Test
-    result = mocked_server.set_entity_status(Light, 1, EntityStatus.ON_OPEN_TRIGGERED)
-    assert mocked_server.is_authenticated
-    assert result
-
-
-@patch("requests.Session.post", side_effect=mock_post_method_error_auth)
-def test_set_status_auth_error(mock_post, mocked_server):
-    assert not mocked_server.is_authenticated
-
-    # Test
-    with pytest.raises(CameDomoticAuthError):
-        mocked_server.set_entity_status(Light, 1, EntityStatus.ON_OPEN_TRIGGERED)
-    assert not mocked_server.is_authenticated
-
-
-@patch("requests.Session.post", side_effect=mock_post_method_error_non_auth)
-def test_set_status_request_error(mock_post, mocked_server):
-    assert not mocked_server.is_authenticated
-
-    # Test
-    successful = mocked_server.set_entity_status(
-        Light, 1, EntityStatus.ON_OPEN_TRIGGERED
-    )
-    assert not successful
-    assert mocked_server.is_authenticated
-
-
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_keep_alive(mock_post, mocked_server):
-    # Prepare the server: features already retrieved but session expired
-    assert not mocked_server.is_authenticated
-
-    # Test
-    result = mocked_server.keep_alive()
-    assert mocked_server.is_authenticated
-    assert result
-
-
-@patch("requests.Session.post", side_effect=mock_post_method_error_auth)
-def test_keep_alive_auth_error(mock_post, mocked_server):
+@pytest.mark.parametrize(
+    "side_effect, raises, succeeds, authenticated_after",
+    [
+        (mock_post_method, None, True, True),
+        (mock_post_method_error_auth, CameDomoticAuthError, None, False),
+        (mock_post_method_error_non_auth, None, False, True),
+    ],
+)
+def test_set_status(
+    mock_post, mocked_server, side_effect, raises, succeeds, authenticated_after
+):
+    mock_post.side_effect = side_effect
     assert not mocked_server.is_authenticated
 
     # Test
-    with pytest.raises(CameDomoticAuthError):
-        mocked_server.keep_alive()
-    assert not mocked_server.is_authenticated
-
-
-@patch("requests.Session.post", side_effect=mock_post_method_error_non_auth)
-def test_keep_alive_request_error(mock_post, mocked_server):
+    if raises:
+        with pytest.raises(raises):
+            mocked_server.set_entity_status(Light, 1, EntityStatus.ON_OPEN_TRIGGERED)
+    else:
+        successful = mocked_server.set_entity_status(
+            Light, 1, EntityStatus.ON_OPEN_TRIGGERED
+        )
+        assert bool(successful) == succeeds
+    assert mocked_server.is_authenticated == authenticated_after
+
+
+@pytest.mark.parametrize(
+    "side_effect, raises, succeeds, authenticated_after",
+    [
+        (mock_post_method, None, True, True),
+        (mock_post_method_error_auth, CameDomoticAuthError, None, False),
+        (mock_post_method_error_non_auth, None, False, True),
+    ],
+)
+def test_keep_alive(
+    mock_post, mocked_server, side_effect, raises, succeeds, authenticated_after
+):
+    mock_post.side_effect = side_effect
     assert not mocked_server.is_authenticated
 
     # Test
-    successful = mocked_server.keep_alive()
-    assert not successful
-    assert mocked_server.is_authenticated
+    if raises:
+        with pytest.raises(raises):
+            mocked_server.keep_alive()
+    else:
+        successful = mocked_server.keep_alive()
+        assert bool(successful) == succeeds
+    assert mocked_server.is_authenticated == authenticated_after
@@ -21,8 +21,9 @@ Test the public special methods of the CameETIDomoServer class (__init__, __ente
 __exit__, __del__).
 """
 
+import copy
 from datetime import datetime, timezone
-from unittest.mock import patch, Mock
+from unittest.mock import patch
 import requests
 import pytest
 from mocked_responses import FEATURE_LIST_RESP
@@ -35,65 +36,89 @@ from came_domotic_unofficial.came_etidomo_server import CameETIDomoServer
 from came_domotic_unofficial.models import CameDomoticRequestError
 
 
-# Assuming these are the public properties of your class
-public_properties = {
-    "is_authenticated": True,
-    "keycode": FEATURE_LIST_RESP["keycode"],
-    "software_version": FEATURE_LIST_RESP["swver"],
-    "server_type": FEATURE_LIST_RESP["type"],
-    "board": FEATURE_LIST_RESP["board"],
-    "serial_number": FEATURE_LIST_RESP["serial"],
-}
-
-
-@patch("requests.Session.get", side_effect=mock_get_init)
-@pytest.mark.parametrize("property_name, expected_value", public_properties.items())
-def test_properties_already_retrieved(mock_get, property_name, expected_value):
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
-
-    # Manually set session attributes to emulate the authentication
-    server._session_id = "my_session_id"
-    server._session_keep_alive_timeout_sec = 900
-    server._session_expiration_timestamp = datetime(3000, 1, 1, tzinfo=timezone.utc)
-    server._cseq = 0
-    server._keycode = str(FEATURE_LIST_RESP["keycode"])
-    server._software_version = str(FEATURE_LIST_RESP["swver"])
-    server._type = str(FEATURE_LIST_RESP["type"])
-    server._board = str(FEATURE_LIST_RESP["board"])
-    server._serial_number = str(FEATURE_LIST_RESP["serial"])
+# Expected values, looked up once at import time
+KEYCODE = FEATURE_LIST_RESP["keycode"]
+SOFTWARE_VERSION = FEATURE_LIST_RESP["swver"]
+SERVER_TYPE = FEATURE_LIST_RESP["type"]
+BOARD = FEATURE_LIST_RESP["board"]
+SERIAL_NUMBER = FEATURE_LIST_RESP["serial"]
+
+# Session expiring in year 3000, i.e. still authenticated
+FAR_FUTURE_TS = datetime(3000, 1, 1, tzinfo=timezone.utc)
+
+# Assuming these are the public properties of your class.
+# A frozen tuple of pairs: parametrize consumes it directly, with the
+# property names doubling as the test ids.
+public_properties = (
+    ("is_authenticated", True),
+    ("keycode", KEYCODE),
+    ("software_version", SOFTWARE_VERSION),
+    ("server_type", SERVER_TYPE),
+    ("board", BOARD),
+    ("serial_number", SERIAL_NUMBER),
+)
 
-    # Override the dispose method to avoid calling the remote server
-    server.dispose = lambda: None  # type: ignore
 
-    assert getattr(server, property_name) == expected_value
+# The three original near-identical tests (values already retrieved, values
+# fetched from the server, fetch failing) are a single parametrized test:
+# the scenario axis selects the POST side effect and the expected outcome.
+_SCENARIOS = ["already_retrieved", "not_retrieved", "request_error"]
 
 
-# Patched GET to mock the check of the server availability in the __init__ phase
-# and POST to mock the retrieval of the properties values from the server
-@patch("requests.Session.get", side_effect=mock_get_init)
-@patch("requests.Session.post", side_effect=mock_post_method)
-@pytest.mark.parametrize("property_name, expected_value", public_properties.items())
-def test_properties_not_retrieved(mock_post, mock_get, property_name, expected_value):
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+@pytest.fixture(scope="module")
+def _server_template() -> CameETIDomoServer:
+    # Run __init__ (with its availability GET) exactly once per module
+    with patch("requests.Session.get", side_effect=mock_get_init):
+        server = CameETIDomoServer("192.168.x.x", "user", "password")
+    # Override the dispose method to avoid calling the remote server
     server.dispose = lambda: None  # type: ignore
+    return server
 
-    if property_name == "is_authenticated":
-        assert getattr(server, property_name) is False  # We're not yet authenticated
-    else:
-        assert getattr(server, property_name) == expected_value
 
+@pytest.fixture
+def mocked_server(_server_template) -> CameETIDomoServer:
+    # A shallow copy gets a fresh __dict__, so per-test attribute writes
+    # never leak back into the pristine template.
+    return copy.copy(_server_template)
 
-@patch("requests.Session.get", side_effect=mock_get_init)
-@patch("requests.Session.post", side_effect=mock_post_method_error_non_auth)
-@pytest.mark.parametrize("property_name, expected_value", public_properties.items())
-def test_properties_not_retrieved_request_error(
-    mock_post, mock_get, property_name, expected_value
+
+@pytest.mark.parametrize("scenario", _SCENARIOS)
+@pytest.mark.parametrize(
+    "property_name, expected_value",
+    public_properties,
+    ids=[name for name, _ in public_properties],
+)
+def test_properties(
+    scenario, property_name, expected_value, mocked_server, monkeypatch
 ):
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
-    server.dispose = lambda: None  # type: ignore
+    server = mocked_server
+    post_side_effect = (
+        mock_post_method_error_non_auth
+        if scenario == "request_error"
+        else mock_post_method
+    )
+
+    # The test never inspects the mock itself, so a direct monkeypatch of
+    # the method is enough: no patcher entry/exit, no MagicMock plumbing.
+    monkeypatch.setattr(requests.Session, "post", post_side_effect)
+
+    if scenario == "already_retrieved":
+        # Manually set session attributes to emulate the authentication
+        server._session_id = "my_session_id"
+        server._session_keep_alive_timeout_sec = 900
+        server._session_expiration_timestamp = FAR_FUTURE_TS
+        server._cseq = 0
+        server._keycode = str(KEYCODE)
+        server._software_version = str(SOFTWARE_VERSION)
+        server._type = str(SERVER_TYPE)
+        server._board = str(BOARD)
+        server._serial_number = str(SERIAL_NUMBER)
 
-    if property_name == "is_authenticated":
-        assert getattr(server, property_name) is False
-    else:
+        assert getattr(server, property_name) == expected_value
+    elif property_name == "is_authenticated":
+        assert getattr(server, property_name) is False  # Not yet authenticated
+    elif scenario == "not_retrieved":
+        assert getattr(server, property_name) == expected_value
+    else:  # request_error
         with pytest.raises(CameDomoticRequestError):
             getattr(server, property_name)
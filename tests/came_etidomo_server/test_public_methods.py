@@ -20,24 +20,21 @@
 
 import copy
 from datetime import datetime, timezone, timedelta
-import json
+from types import SimpleNamespace
 from unittest.mock import patch, Mock
-import freezegun
 import pytest
 import requests
 from mocked_responses import (
     FEATURE_LIST_RESP,
     GENERIC_REPLY,
-    SL_LOGOUT_ACK,
     SL_KEEP_ALIVE_ACK,
-    Command2MockedResponse,
     MockedEntities,
 )
 from utils import (
+    CapturePost,
     mock_get_init,
     mock_post_method,
-    mock_post_method_error_auth,
-    mock_post_method_error_non_auth,
+    scripted_posts,
 )
 from came_domotic_unofficial.came_etidomo_server import CameETIDomoServer
 from came_domotic_unofficial.models import (
@@ -55,214 +52,226 @@ from came_domotic_unofficial.models import (
 )
 
 
+# Session expiring in year 3000, i.e. still authenticated
+FAR_FUTURE_TS = datetime(3000, 1, 1, tzinfo=timezone.utc)
+
+# Expected/cached collections built once at import: the tests only read
+# them (or hand them to the server and compare), never mutate them.
+EXPECTED_FEATURES = frozenset(Feature(name) for name in FEATURE_LIST_RESP["list"])
+CACHED_FEATURES = FeatureSet([Feature("A"), Feature("B"), Feature("C"), Feature("D")])
+CACHED_ENTITIES = CameEntitySet(
+    [CameEntity(1), CameEntity(2), CameEntity(3), CameEntity(4)]
+)
+CACHED_ENTITIES_MIXED = CameEntitySet([Light(1), Light(2), Opening(3), Scenario(4)])
+EXPECTED_LIGHTS = CameEntitySet(
+    item for item in CACHED_ENTITIES_MIXED if isinstance(item, Light)
+)
+
+# Bad-ack reply templates: the originals are flat dicts, so a one-level
+# rebuild at import time is enough, and the tests only ever read them.
+BAD_ACK_REPLY = dict(GENERIC_REPLY, sl_data_ack_reason=1)
+BAD_KEEP_ALIVE_ACK = dict(SL_KEEP_ALIVE_ACK, sl_data_ack_reason=1)
+
+# Expected request envelopes, shared by the request-shape tests
+EXPECTED_DATA_REQ = {"sl_client_id": "my_session_id", "sl_cmd": "sl_data_req"}
+EXPECTED_LOGOUT_REQ = {"sl_client_id": "my_session_id", "sl_cmd": "sl_logout_req"}
+EXPECTED_KEEP_ALIVE_REQ = {
+    "sl_client_id": "my_session_id",
+    "sl_cmd": "sl_keep_alive_req",
+}
+
+
 # region Tests
 
 
-@pytest.fixture
-@patch("requests.Session.get", side_effect=mock_get_init)
-def mocked_server_auth(mock_get) -> CameETIDomoServer:
+@pytest.fixture(scope="module")
+def _auth_snapshot() -> CameETIDomoServer:
     """
-    Fixture that provides an authenticated instance of CameETIDomoServer.
+    Pristine "just authenticated" server snapshot, built once per module.
     """
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+    with patch("requests.Session.get", side_effect=mock_get_init):
+        server = CameETIDomoServer("192.168.x.x", "user", "password")
     # Override the dispose() method to avoid calling the remote server
     server.dispose = lambda: None  # type: ignore # pylint: disable=pointless-statement
 
     # Manually set session attributes to emulate the authentication
     server._session_id = "my_session_id"
-    server._session_expiration_timestamp = datetime(3000, 1, 1, tzinfo=timezone.utc)
+    server._session_expiration_timestamp = FAR_FUTURE_TS
     server._session_keep_alive_timeout_sec = 900
     server._cseq = 0
 
     return server
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_get_features_with_cache(mock_post, mocked_server_auth):
+@pytest.fixture
+def mocked_server_auth(_auth_snapshot) -> CameETIDomoServer:
+    """
+    Fixture that provides an authenticated instance of CameETIDomoServer.
+
+    Each test gets a shallow clone of the snapshot (fresh __dict__, fresh
+    feature/entity caches), so mutations never leak between tests.
+    """
+    server = copy.copy(_auth_snapshot)
+    server._cseq = 0
+    server._features = FeatureSet()
+    server._entities = CameEntitySet()
+    return server
+
+
+# The cache path never inspects the HTTP layer, so patch the narrow
+# _send_command helper on the class itself: no dotted-string resolution
+# into the requests package, and a stronger assertion (not even an
+# internal command is built on a cache hit).
+def test_get_features_with_cache(monkeypatch, mocked_server_auth):
     """
     Test the get_features() method ot the CameETIDomoServer class to ensure that,
     if the self._features attribute is not None or empty, the method returns the cached
     features list and does not submit any POST request to the server.
     """
-
-    cached_features = FeatureSet(
-        [
-            Feature("A"),
-            Feature("B"),
-            Feature("C"),
-            Feature("D"),
-        ]
-    )
+    mock_post = Mock()
+    monkeypatch.setattr(CameETIDomoServer, "_send_command", mock_post)
 
     # Set the features cache
-    mocked_server_auth._features = cached_features
+    mocked_server_auth._features = CACHED_FEATURES
 
     # Call the get_features method
     features = mocked_server_auth.get_features()
 
     # Check if the features list is correct and is retrieved from the cache
-    assert features == cached_features
+    assert features == CACHED_FEATURES
     mock_post.assert_not_called()
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_get_features_no_cache(mock_post, mocked_server_auth):
+# A missing cache and an empty cache are distinct miss cases: run them
+# as separate parametrized tests instead of two phases of one body.
+@pytest.mark.parametrize("initial_cache", [None, FeatureSet()], ids=["none", "empty"])
+def test_get_features_no_cache(monkeypatch, mocked_server_auth, initial_cache):
     """
     Test if the get_features method correctly fetches the features list
     when it is not cached.
     """
-    mock_features = set([Feature(name) for name in FEATURE_LIST_RESP["list"]])
+    mock_post = Mock(side_effect=mock_post_method)
+    monkeypatch.setattr(requests.Session, "post", mock_post)
+    mocked_server_auth._features = initial_cache
 
     # Call the get_features method
     features = mocked_server_auth.get_features()
     assert mock_post.call_count == 1
-    assert features == mock_features
+    assert features == EXPECTED_FEATURES
 
-    # Clear the features cache
-    mocked_server_auth._features = FeatureSet()
 
-    # Call the get_features method
-    features = mocked_server_auth.get_features()
-    assert mock_post.call_count == 2
-    assert features == mock_features
+def _resp(payload=None, status=200):
+    """Lightweight response stub for responses nobody asserts on.
 
+    Mirrors utils._mock_response: a SimpleNamespace is a single allocation,
+    with none of the per-attribute bookkeeping of a full Mock.
+    """
 
-@patch.object(requests.Session, "post")
-def test_get_features_errors(mock_post, mocked_server_auth):
+    def raise_for_status():
+        if response.status_code >= 400:
+            raise requests.HTTPError(f"Mocked HTTP error {response.status_code}")
+
+    response = SimpleNamespace(
+        status_code=status, json=lambda: payload, raise_for_status=raise_for_status
+    )
+    return response
+
+
+def _error_response(scenario):
+    """Build the faulty POST return value for the given error scenario."""
+    if scenario == "http_500":
+        return _resp(status=500)
+    if scenario == "bad_shape":
+        return {"invalid_key": "invalid_value"}
+    return _resp(BAD_ACK_REPLY)
+
+
+@pytest.mark.parametrize(
+    "scenario, raises",
+    [
+        ("http_500", CameDomoticRequestError),
+        ("bad_shape", CameDomoticRequestError),
+        ("bad_ack", CameDomoticBadAckError),
+    ],
+)
+@pytest.mark.parametrize("method", ["get_features", "get_entities"])
+def test_query_methods_errors(
+    monkeypatch, mocked_server_auth, method, scenario, raises
+):
     """
     Test that failures are managed as expected.
     """
     # Data preparation
-    mock_post.return_value.status_code = 500
+    mock_post = Mock(return_value=_error_response(scenario))
+    monkeypatch.setattr(requests.Session, "post", mock_post)
     mocked_server_auth._entities = None
 
-    # Test HTTP error
-    with pytest.raises(CameDomoticRequestError):
+    with pytest.raises(raises):
         # Call the function that sends the POST requests
-        mocked_server_auth.get_features()
+        getattr(mocked_server_auth, method)()
 
-    # Test invalid response
-    mock_post.return_value.status_code = 200
-    mock_post.return_value = {"invalid_key": "invalid_value"}
 
-    with pytest.raises(CameDomoticRequestError):
-        # Call the function that sends the POST requests
-        mocked_server_auth.get_features()
-
-    # Test bad ACK
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = copy.deepcopy(
-        GENERIC_REPLY  # Don't want to write on the original object
-    )
-    mock_response.json.return_value["sl_data_ack_reason"] = 1
-    mock_post.return_value = mock_response
-
-    with pytest.raises(CameDomoticBadAckError):
-        # Call the function that sends the POST requests
-        mocked_server_auth.get_features()
-
-
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_get_features_request(mock_post, mocked_server_auth):
+# Already authenticated, so exactly one POST (the feature list request)
+def test_get_features_request(monkeypatch, mocked_server_auth):
     """
     Test if the get_features method sends a POST message compliant with the
     CAME server interface.
     """
+    script = scripted_posts(FEATURE_LIST_RESP)
+    capture = CapturePost(lambda *a, **kw: next(script))
+    monkeypatch.setattr(requests.Session, "post", capture)
 
     # Call the get_features method
     mocked_server_auth.get_features()
 
-    request_data = json.loads(mock_post.call_args[1]["data"]["command"])
+    request_data = capture.last
     application_data = request_data["sl_appl_msg"]
 
-    expected_request_data = {
-        "sl_client_id": "my_session_id",
-        "sl_cmd": "sl_data_req",
-    }
     expected_application_data = {
         "client": "my_session_id",
         "cmd_name": "feature_list_req",
     }
 
-    assert set(expected_request_data).issubset(set(request_data))
-    assert set(expected_application_data).issubset(set(application_data))
+    assert EXPECTED_DATA_REQ.items() <= request_data.items()
+    assert expected_application_data.items() <= application_data.items()
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_get_entities_with_cache(mock_post, mocked_server_auth):
+def test_get_entities_with_cache(monkeypatch, mocked_server_auth):
     """
     Test the get_entities() method ot the CameETIDomoServer class to ensure that,
     if the self._entities attribute is not None or empty, the method returns the cached
     entities list and does not submit any POST request to the server.
     """
-
-    cached_entities = CameEntitySet(
-        [
-            CameEntity(1),
-            CameEntity(2),
-            CameEntity(3),
-            CameEntity(4),
-        ]
-    )
+    mock_post = Mock()
+    monkeypatch.setattr(CameETIDomoServer, "_send_command", mock_post)
 
     # Set the features cache
-    mocked_server_auth._entities = cached_entities
+    mocked_server_auth._entities = CACHED_ENTITIES
 
     # Call the get_features method
     entities = mocked_server_auth.get_entities()
 
     # Check if the features list is correct and is retrieved from the cache
-    assert entities == cached_entities
+    assert entities == CACHED_ENTITIES
     mock_post.assert_not_called()
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_get_entities_no_cache(mock_post, mocked_server_auth):
+@pytest.mark.parametrize(
+    "initial_cache", [None, CameEntitySet()], ids=["none", "empty"]
+)
+def test_get_entities_no_cache(monkeypatch, mocked_server_auth, initial_cache):
     """
     Test that an HTTP POST request returns the expected data.
     """
+    mock_post = Mock(side_effect=mock_post_method)
+    monkeypatch.setattr(requests.Session, "post", mock_post)
+    mocked_server_auth._entities = initial_cache
+
     entities = mocked_server_auth.get_entities()
     assert entities == MockedEntities
     assert mock_post.call_count > 0
 
 
-@patch.object(requests.Session, "post")
-def test_get_entities_errors(mock_post, mocked_server_auth):
-    """
-    Test that an HTTP POST request returns the expected data.
-    """
-    # Data preparation
-    mock_post.return_value.status_code = 500
-    mocked_server_auth._entities = None
-
-    # Test HTTP error
-    with pytest.raises(CameDomoticRequestError):
-        # Call the function that sends the POST requests
-        mocked_server_auth.get_entities()
-
-    # Test invalid response
-    mock_post.return_value.status_code = 200
-    mock_post.return_value = {"invalid_key": "invalid_value"}
-
-    with pytest.raises(CameDomoticRequestError):
-        # Call the function that sends the POST requests
-        mocked_server_auth.get_entities()
-
-    # Test bad ACK
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = copy.deepcopy(
-        GENERIC_REPLY  # Don't want to write on the original object
-    )
-    mock_response.json.return_value["sl_data_ack_reason"] = 1
-    mock_post.return_value = mock_response
-
-    with pytest.raises(CameDomoticBadAckError):
-        # Call the function that sends the POST requests
-        mocked_server_auth.get_entities()
-
-
 def test_get_entities_filtered(mocked_server_auth):
     """
     Test the get_entities() method ot the CameETIDomoServer class to ensure that,
@@ -270,27 +279,14 @@ def test_get_entities_filtered(mocked_server_auth):
     entities list and does not submit any POST request to the server.
     """
 
-    cached_entities = CameEntitySet(
-        [
-            Light(1),
-            Light(2),
-            Opening(3),
-            Scenario(4),
-        ]
-    )
-
-    filtered_entities = CameEntitySet(
-        [item for item in cached_entities if isinstance(item, Light)]
-    )
-
     # Set the features cache
-    mocked_server_auth._entities = cached_entities
+    mocked_server_auth._entities = CACHED_ENTITIES_MIXED
 
     # Call the get_features method
     entities = mocked_server_auth.get_entities(EntityType.LIGHTS)
 
     # Check if the features list is correct and is retrieved from the cache
-    assert entities == filtered_entities
+    assert entities == EXPECTED_LIGHTS
 
 
 def test_get_entities_filtered_invalid_input(mocked_server_auth):
@@ -305,8 +301,7 @@ def test_get_entities_filtered_invalid_input(mocked_server_auth):
         mocked_server_auth.get_entities("invalid_type")
 
 
-@patch.object(requests.Session, "post")
-def test_get_entities_request(mock_post, mocked_server_auth):
+def test_get_entities_request(mocked_server_auth):
     """
     Test if the get_entities method sends a POST message compliant with the
     CAME server interface.
@@ -315,11 +310,12 @@ def test_get_entities_request(mock_post, mocked_server_auth):
 
 
 # Test the set_entity_status method
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_set_entity_status(mock_post, mocked_server_auth):
+def test_set_entity_status(monkeypatch, mocked_server_auth):
     """
     Test that failures are managed as expected.
     """
+    mock_post = Mock(side_effect=mock_post_method)
+    monkeypatch.setattr(requests.Session, "post", mock_post)
     # Call the set_entity_status method
     result = mocked_server_auth.set_entity_status(
         Light, 1, EntityStatus.ON_OPEN_TRIGGERED
@@ -330,177 +326,139 @@ def test_set_entity_status(mock_post, mocked_server_auth):
     assert result
 
 
-@patch.object(requests.Session, "post")
-def test_set_entity_status_errors(mock_post, mocked_server_auth):
+@pytest.mark.parametrize("scenario", ["http_500", "bad_shape", "bad_ack"])
+def test_set_entity_status_errors(monkeypatch, mocked_server_auth, scenario):
     """
     Test that failures are managed as expected.
     """
+    mock_post = Mock(return_value=_error_response(scenario))
+    monkeypatch.setattr(requests.Session, "post", mock_post)
 
-    # Test bad ack
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = copy.deepcopy(GENERIC_REPLY)
-    mock_response.json.return_value["sl_data_ack_reason"] = 1
-    mock_post.return_value = mock_response
-    assert not mocked_server_auth.set_entity_status(
-        Light, 1, EntityStatus.ON_OPEN_TRIGGERED
-    )
-    mock_post.assert_called_once()
-
-    # Test HTTP error
-    mock_post.return_value.status_code = 500
-    assert not mocked_server_auth.set_entity_status(
-        Light, 1, EntityStatus.ON_OPEN_TRIGGERED
-    )
-
-    # Test invalid response
-    mock_post.return_value.status_code = 200
-    mock_post.return_value = {"invalid_key": "invalid_value"}
     assert not mocked_server_auth.set_entity_status(
         Light, 1, EntityStatus.ON_OPEN_TRIGGERED
     )
+    if scenario == "bad_ack":
+        mock_post.assert_called_once()
 
 
 # Test the set_entity_status method when the input is invalid
-def test_set_entity_status_invalid_inputs(mocked_server_auth):
+@pytest.mark.parametrize(
+    "args, kwargs",
+    [
+        (("invalid_type", 1, EntityStatus.OFF_STOPPED), {}),
+        ((Light, "invalid_id", EntityStatus.OFF_STOPPED), {}),
+        ((Light, 1, "invalid_status"), {}),
+        (
+            (Light, 1, EntityStatus.OFF_STOPPED),
+            {"brightness": "invalid_brightness"},
+        ),
+    ],
+    ids=["bad_type", "bad_id", "bad_status", "bad_brightness"],
+)
+def test_set_entity_status_invalid_inputs(mocked_server_auth, args, kwargs):
     """
     Test that failures are managed as expected.
     """
-    # Test invalid input
-    with pytest.raises(TypeError):
-        mocked_server_auth.set_entity_status(
-            "invalid_type", 1, EntityStatus.OFF_STOPPED
-        )
-
-    with pytest.raises(TypeError):
-        mocked_server_auth.set_entity_status(
-            Light, "invalid_id", EntityStatus.OFF_STOPPED
-        )
-
     with pytest.raises(TypeError):
-        mocked_server_auth.set_entity_status(Light, 1, "invalid_status")
-
-    with pytest.raises(TypeError):
-        mocked_server_auth.set_entity_status(
-            Light, 1, EntityStatus.OFF_STOPPED, brightness="invalid_brightness"
-        )
-
-
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_set_entity_status_request_light(mock_post, mocked_server_auth):
+        mocked_server_auth.set_entity_status(*args, **kwargs)
+
+
+# The three entity types only differ in kwargs and expected payload, so
+# one parametrized body replaces the three near-identical tests.
+@pytest.mark.parametrize(
+    "entity_type, kwargs, expected_application_data",
+    [
+        (
+            Light,
+            {"brightness": 87},
+            {
+                "act_id": 999,
+                "client": "my_session_id",
+                "cmd_name": "light_switch_req",
+                "wanted_status": EntityStatus.ON_OPEN_TRIGGERED.value,
+                "perc": 87,
+            },
+        ),
+        (
+            Opening,
+            {},
+            {
+                "act_id": 999,
+                "client": "my_session_id",
+                "cmd_name": "opening_move_req",
+                "wanted_status": EntityStatus.ON_OPEN_TRIGGERED.value,
+            },
+        ),
+        (
+            Scenario,
+            {},
+            {
+                "id": 999,
+                "client": "my_session_id",
+                "cmd_name": "scenario_activation_req",
+            },
+        ),
+    ],
+    ids=["light", "opening", "scenario"],
+)
+def test_set_entity_status_request(
+    monkeypatch, mocked_server_auth, entity_type, kwargs, expected_application_data
+):
     """
     Test that the POST request is compliant with the CAME server interface.
     """
-    # Call the set_entity_status method
-    mocked_server_auth.set_entity_status(
-        Light,
-        999,
-        EntityStatus.ON_OPEN_TRIGGERED,
-        brightness=87,
-    )
-
-    request_data = json.loads(mock_post.call_args[1]["data"]["command"])
-    application_data = request_data["sl_appl_msg"]
-
-    expected_request_data = {
-        "sl_client_id": "my_session_id",
-        "sl_cmd": "sl_data_req",
-    }
-    expected_application_data = {
-        "act_id": 999,
-        "client": "my_session_id",
-        "cmd_name": "light_switch_req",
-        "wanted_status": EntityStatus.ON_OPEN_TRIGGERED.value,
-        "perc": 87,
-    }
-
-    assert set(expected_request_data).issubset(set(request_data))
-    assert set(expected_application_data).issubset(set(application_data))
+    capture = CapturePost()
+    monkeypatch.setattr(requests.Session, "post", capture)
 
-
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_set_entity_status_request_opening(mock_post, mocked_server_auth):
-    """
-    Test that the POST request is compliant with the CAME server interface.
-    """
     # Call the set_entity_status method
     mocked_server_auth.set_entity_status(
-        Opening,
-        999,
-        EntityStatus.ON_OPEN_TRIGGERED,
+        entity_type, 999, EntityStatus.ON_OPEN_TRIGGERED, **kwargs
     )
 
-    request_data = json.loads(mock_post.call_args[1]["data"]["command"])
+    request_data = capture.last
     application_data = request_data["sl_appl_msg"]
 
-    expected_request_data = {
-        "sl_client_id": "my_session_id",
-        "sl_cmd": "sl_data_req",
-    }
-    expected_application_data = {
-        "act_id": 999,
-        "client": "my_session_id",
-        "cmd_name": "opening_move_req",
-        "wanted_status": EntityStatus.ON_OPEN_TRIGGERED.value,
-    }
+    assert EXPECTED_DATA_REQ.items() <= request_data.items()
+    assert expected_application_data.items() <= application_data.items()
 
-    assert set(expected_request_data).issubset(set(request_data))
-    assert set(expected_application_data).issubset(set(application_data))
 
+@pytest.fixture
+def dispose_server():
+    """Freshly built server with the whole HTTP layer mocked.
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_set_entity_status_request_scenario(mock_post, mocked_server_auth):
-    """
-    Test that the POST request is compliant with the CAME server interface.
+    One fixture replaces the 2-3 stacked @patch decorators of the dispose
+    tests below: the server is constructed once per test under a single
+    set of patches, and each test tweaks mock_post.side_effect as needed.
     """
-    # Call the set_entity_status method
-    mocked_server_auth.set_entity_status(
-        Scenario,
-        999,
-        EntityStatus.ON_OPEN_TRIGGERED,
-    )
+    with (
+        patch("requests.Session.get", side_effect=mock_get_init),
+        patch("requests.Session.post", side_effect=mock_post_method) as mock_post,
+        patch.object(requests.Session, "close") as mock_close,
+    ):
+        server = CameETIDomoServer("192.168.x.x", "user", "password")
+        yield server, mock_post, mock_close
 
-    request_data = json.loads(mock_post.call_args[1]["data"]["command"])
-    application_data = request_data["sl_appl_msg"]
 
-    expected_request_data = {
-        "sl_client_id": "my_session_id",
-        "sl_cmd": "sl_data_req",
-    }
-    expected_application_data = {
-        "id": 999,
-        "client": "my_session_id",
-        "cmd_name": "opening_move_req",
-    }
-
-    assert set(expected_request_data).issubset(set(request_data))
-    assert set(expected_application_data).issubset(set(application_data))
-
-
-@patch("requests.Session.get", side_effect=mock_get_init)
-@patch.object(requests.Session, "close")
-def test_dispose_close_http_session(mock_close, mock_get):
+def test_dispose_close_http_session(dispose_server):
     """
     Test that the dispose method closes the http session.
     """
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+    server, _, mock_close = dispose_server
 
     # Call the dispose method
     server.dispose()
     mock_close.assert_called_once()
 
 
-@patch("requests.Session.get", side_effect=mock_get_init)
-@patch("requests.Session.post", side_effect=requests.exceptions.RequestException)
-@patch.object(requests.Session, "close")
-def test_dispose_post_with_exception(mock_close, mock_post, mock_get):
+def test_dispose_post_with_exception(dispose_server):
     """
     Test that the dispose method closes the http session even if an exception is raised
     while sending the logout POST request.
     """
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+    server, mock_post, mock_close = dispose_server
+    mock_post.side_effect = requests.exceptions.RequestException
     server._session_id = "my_session_id"
-    server._session_expiration_timestamp = datetime(3000, 1, 1, tzinfo=timezone.utc)
+    server._session_expiration_timestamp = FAR_FUTURE_TS
 
     # Call the dispose method
     server.dispose()
@@ -510,65 +468,67 @@ def test_dispose_post_with_exception(mock_close, mock_post, mock_get):
     server.dispose = lambda: None  # type: ignore
 
 
-@patch("requests.Session.get", side_effect=mock_get_init)
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_dispose_post_request(mock_post, mock_get):
+def test_dispose_post_request(dispose_server):
     """
     Test that the dispose method sends a POST request to the server
     and that the request is compliant with the CAME server interface.
     """
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+    server, mock_post, _ = dispose_server
+    capture = mock_post.side_effect = CapturePost()
     server._session_id = "my_session_id"
-    server._session_expiration_timestamp = datetime(3000, 1, 1, tzinfo=timezone.utc)
+    server._session_expiration_timestamp = FAR_FUTURE_TS
 
     # Call the dispose method
     server.dispose()
 
-    request_data = json.loads(mock_post.call_args[1]["data"]["command"])
-
-    expected_request_data = {"sl_client_id": "my_session_id", "sl_cmd": "sl_logout_req"}
+    request_data = capture.last
 
     mock_post.assert_called_once()
-    assert set(expected_request_data).issubset(set(request_data))
+    assert EXPECTED_LOGOUT_REQ.items() <= request_data.items()
 
 
-@freezegun.freeze_time("2020-01-01")
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_keep_alive_success(mock_post, mocked_server_auth):
+def test_keep_alive_success(monkeypatch, mocked_server_auth):
     """
     Test that the keep_alive method returns True when the server responds with a
     status code of 200 and the expected data.
     """
+    mock_post = Mock(side_effect=mock_post_method)
+    monkeypatch.setattr(requests.Session, "post", mock_post)
     # Set the session expiration timestamp to a value close to now
     mocked_server_auth._session_expiration_timestamp = datetime.now(
         timezone.utc
     ) + timedelta(seconds=30)
 
-    # Call the set_entity_status method
+    # Bracket the call between two real clock reads instead of freezing
+    # time: freeze_time repatches the whole datetime module per test.
+    before = datetime.now(timezone.utc)
     successful = mocked_server_auth.keep_alive()
+    after = datetime.now(timezone.utc)
 
     # Check if the post method was called and the session expiration have been
     # extended as expected
     mock_post.assert_called_once()
     assert successful
-    assert mocked_server_auth._session_expiration_timestamp == datetime.now(
-        timezone.utc
-    ) + timedelta(seconds=mocked_server_auth._session_keep_alive_timeout_sec)
+    keep_alive_timeout = timedelta(
+        seconds=mocked_server_auth._session_keep_alive_timeout_sec
+    )
+    assert (
+        before + keep_alive_timeout
+        <= mocked_server_auth._session_expiration_timestamp
+        <= after + keep_alive_timeout
+    )
 
 
-@patch("requests.Session.post")
-def test_keep_alive_bad_ack(mock_post, mocked_server_auth):
+def test_keep_alive_bad_ack(monkeypatch, mocked_server_auth):
     """
     Test that the keep_alive method returns False when the server responds with a
     non-zero ack code.
     """
-    # Create a mock response with status code 200 and some data
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = copy.deepcopy(SL_KEEP_ALIVE_ACK)
-    mock_response.json.return_value["sl_data_ack_reason"] = 1
+    # Create a stub response with status code 200 and some data
+    mock_response = _resp(BAD_KEEP_ALIVE_ACK)
 
-    mock_post.return_value = mock_response
+    mock_post = Mock(return_value=mock_response)
+    monkeypatch.setattr(requests.Session, "post", mock_post)
 
     # Call the set_entity_status method
     successful = mocked_server_auth.keep_alive()
@@ -578,14 +538,14 @@ def test_keep_alive_bad_ack(mock_post, mocked_server_auth):
     assert not successful
 
 
-@patch.object(requests.Session, "post")
-def test_keep_alive_exceptions(mock_post, mocked_server_auth):
+def test_keep_alive_exceptions(monkeypatch, mocked_server_auth):
     """
     Test that the keep_alive method returns False when the server responds with a
     non-zero ack code.
     """
     # Create a mock response with status code 200 and some data
-    mock_post.side_effect = CameDomoticRequestError()
+    mock_post = Mock(side_effect=CameDomoticRequestError())
+    monkeypatch.setattr(requests.Session, "post", mock_post)
 
     # Call the set_entity_status method
     successful = mocked_server_auth.keep_alive()
@@ -601,22 +561,19 @@ def test_keep_alive_exceptions(mock_post, mocked_server_auth):
     assert not successful
 
 
-@patch("requests.Session.post", side_effect=mock_post_method)
-def test_keep_alive_request(mock_post, mocked_server_auth):
+def test_keep_alive_request(monkeypatch, mocked_server_auth):
     """
     Test that the POST request is compliant with the CAME server interface.
     """
+    capture = CapturePost()
+    monkeypatch.setattr(requests.Session, "post", capture)
+
     # Call the set_entity_status method
     mocked_server_auth.keep_alive()
 
-    request_data = json.loads(mock_post.call_args[1]["data"]["command"])
-
-    expected_request_data = {
-        "sl_client_id": "my_session_id",
-        "sl_cmd": "sl_keep_alive_req",
-    }
+    request_data = capture.last
 
-    assert set(expected_request_data).issubset(set(request_data))
+    assert EXPECTED_KEEP_ALIVE_REQ.items() <= request_data.items()
 
 
 # endregion
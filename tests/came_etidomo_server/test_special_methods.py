@@ -21,7 +21,7 @@ Test the public special methods of the CameETIDomoServer class (__init__, __ente
 __exit__, __del__).
 """
 
-from datetime import datetime, timezone
+import copy
 import gc
 from unittest.mock import patch
 import pytest
@@ -33,21 +33,32 @@ from came_domotic_unofficial.came_etidomo_server import (
 )
 
 
+@pytest.fixture(scope="module")
+def _server_template() -> CameETIDomoServer:
+    # Run __init__ (with its availability GET) exactly once per module
+    with patch("requests.Session.get", side_effect=mock_get_init):
+        server = CameETIDomoServer("192.168.x.x", "user", "password")
+    server.dispose = lambda: None  # type: ignore
+    return server
+
+
 @pytest.fixture
-@patch("requests.Session.get", side_effect=mock_get_init)
-def mocked_server(mock_get) -> CameETIDomoServer:
+def mocked_server(_server_template) -> CameETIDomoServer:
     """
     Fixture that provides an authenticated instance of CameETIDomoServer.
+
+    A shallow copy gets a fresh __dict__, so per-test attribute writes
+    never leak back into the pristine template.
     """
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
-    server.dispose = lambda: None  # type: ignore
-    return server
+    return copy.copy(_server_template)
 
 
-@patch("requests.Session.get")
-def test_init_with_valid_input(mock_get):
-    mock_get.return_value.status_code = 200
-    server = CameETIDomoServer("192.168.x.x", "user", "password")
+# The constructor is the only statement that touches the network, so the
+# patches below are with-blocks around it instead of whole-test decorators.
+def test_init_with_valid_input():
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.status_code = 200
+        server = CameETIDomoServer("192.168.x.x", "user", "password")
     assert server._host == "192.168.x.x"
     assert server._username == "user"
     assert server._password == "password"
@@ -73,18 +84,20 @@ def test_init_with_non_string_password():
         CameETIDomoServer("192.168.x.x", "user", 123)
 
 
-@patch("requests.Session.get")
-def test_init_with_unavailable_server(mock_get):
-    mock_get.return_value.status_code = 404
-    with pytest.raises(CameDomoticServerNotFoundError):
-        CameETIDomoServer("192.168.x.x", "user", "password")
+def test_init_with_unavailable_server():
+    with patch("requests.Session.get") as mock_get:
+        mock_get.return_value.status_code = 404
+        with pytest.raises(CameDomoticServerNotFoundError):
+            CameETIDomoServer("192.168.x.x", "user", "password")
 
 
-@patch("requests.Session.get")
-def test_init_with_request_exception(mock_get):
-    mock_get.side_effect = requests.exceptions.RequestException("Request error")
-    with pytest.raises(CameDomoticServerNotFoundError):
-        CameETIDomoServer("192.168.x.x", "user", "password")
+def test_init_with_request_exception():
+    with patch(
+        "requests.Session.get",
+        side_effect=requests.exceptions.RequestException("Request error"),
+    ):
+        with pytest.raises(CameDomoticServerNotFoundError):
+            CameETIDomoServer("192.168.x.x", "user", "password")
 
 
 def test_context_manager_entering(mocked_server):
@@ -131,8 +144,10 @@ def test_garbage_collector_calls_dispose(mock_dispose, mock_get):
     """
     server = CameETIDomoServer("192.168.x.x", "user", "password")
 
-    # Force the garbage collector to call the __del__ method
+    # Force the garbage collector to call the __del__ method. The server
+    # was just allocated, so a generation-0 pass is enough to break any
+    # cycle keeping it alive - no need for a full-heap sweep.
     del server
-    gc.collect()
+    gc.collect(0)
 
     assert mock_dispose.call_count >= 1
@@ -21,9 +21,11 @@ These responses are used to test the CAME Domotic server client.
 # pylint: disable=no-name-in-module
 # pylint: disable=unused-argument
 
-import copy
 import json
-from unittest.mock import Mock
+import re
+from types import SimpleNamespace
+
+import requests
 from mocked_responses import (
     SL_REGISTRATION_ACK,
     FEATURE_LIST_RESP,
@@ -68,6 +70,14 @@ COMMAND_TO_RESPONSE = {
     # "loadsctrl_relay_set_req": None,
 }
 
+# Pre-serialized payloads: json.loads of a cached string hands each call
+# a fresh mutable dict several times faster than copy.deepcopy, which
+# walks the reduce protocol and a memo table on every node.
+_COMMAND_TO_RESPONSE_JSON = {
+    cmd: json.dumps(payload) for cmd, payload in COMMAND_TO_RESPONSE.items()
+}
+_GENERIC_REPLY_JSON = json.dumps(GENERIC_REPLY)
+
 
 ###################
 #  USAGE EXAMPLE  #
@@ -76,11 +86,31 @@ COMMAND_TO_RESPONSE = {
 #
 # @patch("requests.Session.get", side_effect=mock_get_init)
 # def test_my_test(mock_get, mocked_server):
+def _mock_response(status_code, payload=None):
+    """Build a lightweight fake HTTP response.
+
+    A SimpleNamespace with status_code, json() and raise_for_status() is
+    all the server code touches, and it skips the per-attribute
+    bookkeeping a full unittest.mock.Mock would do on every access.
+    """
+
+    def raise_for_status():
+        # Read the live attribute: the error dispatchers below override
+        # status_code after the response has been built
+        if response.status_code >= 400:
+            raise requests.HTTPError(f"Mocked HTTP error {response.status_code}")
+
+    response = SimpleNamespace(
+        status_code=status_code,
+        json=lambda: payload,
+        raise_for_status=raise_for_status,
+    )
+    return response
+
+
 def mock_get_init(*args, **kwargs):
     """Mock the GET response when creating a CameETIDomoServer instance."""
-    mock_response = Mock()
-    mock_response.status_code = 200
-    return mock_response
+    return _mock_response(200)
 
 
 ###################
@@ -90,37 +120,35 @@ def mock_get_init(*args, **kwargs):
 #
 # @patch("requests.Session.post", side_effect=mock_post_method)
 # def test_my_test(mock_post, mocked_server):
+# The dispatcher only needs the command name, so a compiled regex probe of
+# the raw body replaces a full json.loads of the outgoing payload. cmd_name
+# (the application-level command) wins over the sl_cmd envelope, matching
+# the lookup order of the previous dict-based extraction.
+_CMD_NAME_RE = re.compile(r'"cmd_name"\s*:\s*"([^"]+)"')
+_SL_CMD_RE = re.compile(r'"sl_cmd"\s*:\s*"([^"]+)"')
+
+
 def mock_post_method(*args, **kwargs):
     """Mock the all the POST responses when sending a command to the server."""
 
-    mock_response = Mock()
-    mock_response.status_code = 200
+    payload = None
 
-    if "data" in kwargs and "command" in kwargs["data"]:
-        request_data = json.loads(kwargs["data"]["command"])
-    elif "json" in kwargs and "command" in kwargs["json"]:
-        request_data = json.loads(kwargs["json"]["command"])
+    # Single .get per container instead of paired "in" probes and
+    # __getitem__ calls that hash the same keys twice
+    body = kwargs.get("data") or kwargs.get("json")
+    raw_command = body.get("command", "") if body else ""
 
-    if request_data:
-        if "sl_appl_msg" in request_data and "cmd_name" in request_data["sl_appl_msg"]:
-            came_cmd_name = request_data["sl_appl_msg"]["cmd_name"]
-        elif "sl_cmd" in request_data:
-            came_cmd_name = request_data["sl_cmd"]
-        else:
-            came_cmd_name = None
+    match = _CMD_NAME_RE.search(raw_command) or _SL_CMD_RE.search(raw_command)
+    came_cmd_name = match.group(1) if match else None
 
     if came_cmd_name:
-        # Using copy.deepcopy to enable playing on the response object
-        # without messing up the original COMMAND_TO_RESPONSE object
-        mock_response.json.return_value = copy.deepcopy(
-            (
-                COMMAND_TO_RESPONSE[came_cmd_name]
-                if came_cmd_name in COMMAND_TO_RESPONSE
-                else GENERIC_REPLY
-            )
+        # Round-trip the cached JSON string so callers can play with the
+        # response object without messing up the original payloads
+        payload = json.loads(
+            _COMMAND_TO_RESPONSE_JSON.get(came_cmd_name, _GENERIC_REPLY_JSON)
         )
 
-    return mock_response
+    return _mock_response(200, payload)
 
 
 def mock_post_method_error_auth(*args, **kwargs):
@@ -130,7 +158,7 @@ def mock_post_method_error_auth(*args, **kwargs):
     request will return an error.
     """
     mock_response = mock_post_method(*args, **kwargs)
-    response_data = mock_response.json.return_value
+    response_data = mock_response.json()
 
     if not response_data:
         sl_cmd = None
@@ -153,7 +181,7 @@ def mock_post_method_error_non_auth(*args, **kwargs):
     Only the authentication requests will work, every other POST request will fail.
     """
     mock_response = mock_post_method(*args, **kwargs)
-    response_data = mock_response.json.return_value
+    response_data = mock_response.json()
 
     if not response_data:
         sl_cmd = None
@@ -168,3 +196,41 @@ def mock_post_method_error_non_auth(*args, **kwargs):
         mock_response.status_code = 500
 
     return mock_response
+
+
+class CapturePost:
+    """POST side effect that decodes the outgoing command as it is sent.
+
+    Request-shape tests used to re-read the body afterwards via
+    mock_post.call_args[1]["data"]["command"] and json.loads it; wrapping
+    the dispatcher instead parses the payload exactly once, and the test
+    reads the decoded dict from ``last``.
+
+    Usage:
+        capture = mock_post.side_effect = CapturePost()
+        server.keep_alive()
+        assert capture.last["sl_cmd"] == "sl_keep_alive_req"
+    """
+
+    def __init__(self, side_effect=mock_post_method):
+        self._side_effect = side_effect
+        self.last = None
+
+    def __call__(self, *args, **kwargs):
+        self.last = json.loads(kwargs["data"]["command"])
+        return self._side_effect(*args, **kwargs)
+
+
+def scripted_posts(*payloads):
+    """Scripted POST responses for tests with a known request sequence.
+
+    Returns an iterator of pre-built responses: used as a side_effect,
+    Mock advances it without running any Python dispatch per call, unlike
+    the body-inspecting mock_post_method.
+
+    Usage:
+        @patch("requests.Session.post", side_effect=scripted_posts(RESP_A, RESP_B))
+    """
+    return iter(
+        [_mock_response(200, json.loads(json.dumps(payload))) for payload in payloads]
+    )
@@ -119,6 +119,34 @@ def test_came_entity_set_not_valid_status():
     assert entity.status == EntityStatus.UNKNOWN
 
 
+@given(
+    new_status=sampled_from(EntityStatus),
+)
+def test_came_entity_set_status_from_int(new_status):
+    """
+    Test if the status property of the CameEntity class can be set from
+    the raw integer value coming from the wire protocol.
+    """
+    entity = CameEntity(1)
+
+    entity.status = new_status.value
+    assert entity.status == new_status
+    assert isinstance(entity.status, EntityStatus)
+
+
+def test_came_entity_set_unmapped_int_status():
+    """
+    Test if the status property of the CameEntity class can be set to
+    an integer that doesn't map to any EntityStatus member.
+    """
+    entity = CameEntity(1)
+
+    with pytest.raises(TypeError):
+        entity.status = 999
+
+    assert entity.status == EntityStatus.UNKNOWN
+
+
 @given(
     entity_id=integers(),
     name=text(min_size=1),
@@ -368,6 +396,50 @@ def test_came_entitiesset_add_invalid_item():
     assert str(exc_info.value) == "Item must be of type 'CameEntity'"
 
 
+def test_came_entitiesset_update_valid_items():
+    """
+    Test if multiple valid items can be added to the CameEntitiesSet
+    with a single update call.
+    """
+    entity1 = CameEntity(1, "Test Entity 1")
+    entity2 = CameEntity(2, "Test Entity 2")
+    entities_set = CameEntitySet()
+    entities_set.update([entity1, entity2])
+
+    assert entity1 in entities_set
+    assert entity2 in entities_set
+    assert len(entities_set) == 2
+
+
+def test_came_entitiesset_update_invalid_item():
+    """
+    Test if an update with an invalid item is rejected as a whole,
+    without inserting the valid items of the same batch.
+    """
+    entities_set = CameEntitySet()
+
+    with pytest.raises(TypeError) as exc_info:
+        entities_set.update([CameEntity(1), "Invalid Item", CameEntity(2)])
+
+    assert str(exc_info.value) == "Item must be of type 'CameEntity'"
+    assert len(entities_set) == 0
+
+
+def test_came_entitiesset_update_same_type_set():
+    """
+    Test if an update with another CameEntitiesSet (already validated on
+    insertion) adds all its items.
+    """
+    entity1 = CameEntity(1, "Test Entity 1")
+    entity2 = CameEntity(2, "Test Entity 2")
+    other_set = CameEntitySet([entity1, entity2])
+    entities_set = CameEntitySet()
+    entities_set.update(other_set)
+
+    assert entities_set == other_set
+    assert len(entities_set) == 2
+
+
 def test_came_entitiesset_add_duplicate_item():
     """
     Test if a duplicate item can be added to the CameEntitiesSet.
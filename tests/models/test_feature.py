@@ -16,6 +16,9 @@
 Unit tests for the Feature and FeatureSet classes.
 """
 
+import gc
+import weakref
+
 import pytest
 from hypothesis import given
 from hypothesis.strategies import integers, text, lists
@@ -104,6 +107,33 @@ def test_feature_equality_operators():
     assert feature1 != other_type3
 
 
+def test_feature_interning_same_name():
+    """
+    Test if creating two features with the same name returns the same
+    (interned) instance.
+    """
+    feature1 = Feature("Interned Feature")
+    feature2 = Feature("Interned Feature")
+
+    assert feature1 is feature2
+
+
+def test_feature_interning_eviction():
+    """
+    Test if a feature is evicted from the interning cache once the last
+    reference is dropped, so a later creation builds a fresh instance.
+    """
+    feature = Feature("Short-lived Feature")
+    ref = weakref.ref(feature)
+
+    del feature
+    gc.collect()
+
+    # The weak cache let the instance die, and a new creation starts over
+    assert ref() is None
+    assert Feature("Short-lived Feature").name == "Short-lived Feature"
+
+
 def test_feature_hash_function():
     """
     Test if the Feature hash function works correctly.
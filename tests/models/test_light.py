@@ -237,7 +237,9 @@ def test_light_from_json_method_missing_required_keys():
 
 @given(
     status=integers(min_value=100),
-    light_type=text(min_size=1),
+    # Exclude the real wire values ("STEP_STEP"/"DIMMER"): the test is
+    # about unknown types falling back to the default.
+    light_type=text(min_size=1).filter(lambda t: t not in LightType._value2member_map_),
 )
 def test_light_from_json_unknown_status_and_light_type(status, light_type):
     """
@@ -320,3 +322,17 @@ def test_light_from_json_method_unexpected_properties():
     )
 
     assert light == check_light
+
+
+def test_light_from_json_batch_method():
+    """
+    Test if the Light from_json_batch method works correctly.
+    """
+
+    json_list = [
+        {"act_id": 1, "name": "Test 1", "status": 0, "type": "DIMMER", "perc": 50},
+        {"act_id": 2},
+    ]
+    lights = Light.from_json_batch(json_list)
+
+    assert lights == [Light.from_json(json_data) for json_data in json_list]
@@ -272,3 +272,24 @@ def test_opening_from_json_unexpected_properties():
     )
 
     assert opening == check_opening
+
+
+def test_opening_from_json_batch_method():
+    """
+    Test if the Opening from_json_batch method works correctly.
+    """
+
+    json_list = [
+        {
+            "open_act_id": 1,
+            "close_act_id": 2,
+            "name": "Test",
+            "status": 0,
+            "partial": [],
+            "type": 0,
+        },
+        {"open_act_id": 3},
+    ]
+    openings = Opening.from_json_batch(json_list)
+
+    assert openings == [Opening.from_json(json_data) for json_data in json_list]
@@ -0,0 +1,94 @@
+# Copyright 2024 - GitHub user: fredericks1982
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the wire decoders (msgspec fast path or json fallback).
+"""
+
+from came_domotic_unofficial.models import (
+    DigitalInput,
+    EntityStatus,
+    Light,
+    LightType,
+    Opening,
+    Scenario,
+)
+from came_domotic_unofficial.models.wire import (
+    decode_digital_inputs,
+    decode_lights,
+    decode_openings,
+    decode_scenarios,
+)
+
+
+def test_decode_lights():
+    """Test decoding a JSON array of lights."""
+    raw = (
+        '[{"act_id": 1, "name": "My light", "status": 1, '
+        '"type": "DIMMER", "perc": 66}]'
+    )
+    lights = decode_lights(raw)
+
+    assert lights == [
+        Light(
+            1,
+            "My light",
+            status=EntityStatus.ON_OPEN_TRIGGERED,
+            light_type=LightType.DIMMABLE,
+            brightness=66,
+        )
+    ]
+
+
+def test_decode_openings():
+    """Test decoding a JSON array of openings."""
+    raw = (
+        '[{"open_act_id": 26, "close_act_id": 27, "name": "My opening", '
+        '"status": 0, "partial": [], "type": 0}]'
+    )
+    openings = decode_openings(raw)
+
+    assert openings == [
+        Opening(
+            26,
+            "My opening",
+            close_entity_id=27,
+            status=EntityStatus.OFF_STOPPED,
+        )
+    ]
+
+
+def test_decode_digital_inputs():
+    """Test decoding a JSON array of digital inputs."""
+    raw = (
+        '[{"name": "My button", "act_id": 11, "type": 1, "addr": 0, '
+        '"ack": 1, "radio_node_id": "00000000", "rf_radio_link_quality": 0, '
+        '"utc_time": 0}]'
+    )
+    digital_inputs = decode_digital_inputs(raw)
+
+    assert digital_inputs == [DigitalInput(11, "My button")]
+
+
+def test_decode_scenarios():
+    """Test decoding a JSON array of scenarios."""
+    raw = '[{"id": 6, "name": "Close all openings"}]'
+    scenarios = decode_scenarios(raw)
+
+    assert scenarios == [Scenario(6, "Close all openings")]
+
+
+def test_decode_empty_array():
+    """Test decoding an empty JSON array."""
+    assert decode_lights("[]") == []